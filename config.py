@@ -4,8 +4,10 @@ Handles loading and saving of application configuration.
 """
 
 import os
+import copy
 import json
 import logging
+import functools
 from typing import Dict, Any, Optional
 
 # Configure logger
@@ -48,6 +50,15 @@ Response format:
     }
 }
 
+# Sentinel for keys missing from the configuration
+_MISSING = object()
+
+# Contents of the config file and its mtime, reused while the file is unchanged
+_file_cache: Optional[Dict[str, Any]] = None
+_file_mtime: Optional[float] = None
+# Whether the config file on disk is indented
+_file_pretty: bool = False
+
 # Timing constants
 WAIT_SHORT = 1  # 1 second
 WAIT_MEDIUM = 5  # 5 seconds
@@ -61,46 +72,86 @@ def load_config() -> Dict[str, Any]:
     Returns:
         Dict containing configuration values
     """
+    global _file_cache, _file_mtime, _file_pretty
+    
     try:
-        if os.path.exists(CONFIG_FILE):
-            with open(CONFIG_FILE, 'r') as f:
-                config = json.load(f)
+        mtime = _get_mtime()
+        if mtime is not None:
+            # Only parse the file again if it changed since the last read
+            if _file_cache is None or mtime != _file_mtime:
+                with open(CONFIG_FILE, 'r') as f:
+                    text = f.read()
+                _file_cache = json.loads(text)
+                _file_pretty = "\n" in text.strip()
+                _file_mtime = mtime
                 logger.info("Configuration loaded from file")
-                
-                # Merge with defaults to ensure all required keys exist
-                merged_config = DEFAULT_CONFIG.copy()
-                merged_config.update(config)
-                
-                return merged_config
+            
+            # Merge with defaults to ensure all required keys exist
+            merged_config = DEFAULT_CONFIG.copy()
+            merged_config.update(_file_cache)
+            
+            # Callers may modify the result, so don't share the cached dicts
+            return copy.deepcopy(merged_config)
         else:
-            # Create default config file
-            save_config(DEFAULT_CONFIG)
+            # Create default config file, readable for manual editing
+            save_config(DEFAULT_CONFIG, pretty=True)
             logger.info("Created default configuration file")
-            return DEFAULT_CONFIG
+            return copy.deepcopy(DEFAULT_CONFIG)
     except Exception as e:
         logger.error(f"Error loading configuration: {str(e)}")
         logger.info("Using default configuration")
-        return DEFAULT_CONFIG
+        return copy.deepcopy(DEFAULT_CONFIG)
 
-def save_config(config: Dict[str, Any]) -> bool:
+def save_config(config: Dict[str, Any], pretty: bool = False) -> bool:
     """
     Save configuration to config file.
     
     Args:
         config: Dict containing configuration values
+        pretty: Whether to indent the output for human readers
         
     Returns:
         Boolean indicating whether save was successful
     """
+    global _file_cache, _file_mtime, _file_pretty
+    
     try:
+        # Skip the write if the file already holds this configuration in the requested format
+        if (_file_cache is not None and config == _file_cache and _get_mtime() == _file_mtime
+                and (_file_pretty or not pretty)):
+            logger.debug("Configuration unchanged, not saving")
+            return True
+        
         with open(CONFIG_FILE, 'w') as f:
-            json.dump(config, f, indent=4)
+            if pretty:
+                json.dump(config, f, indent=4)
+            else:
+                json.dump(config, f)
             logger.info("Configuration saved to file")
-            return True
+        
+        _file_cache = copy.deepcopy(config)
+        _file_mtime = _get_mtime()
+        _file_pretty = pretty
+        
+        # Drop cached values so readers see the new configuration
+        _get_cached_config_value.cache_clear()
+        return True
     except Exception as e:
         logger.error(f"Error saving configuration: {str(e)}")
         return False
 
+def _get_mtime() -> Optional[float]:
+    """
+    Get the modification time of the config file.
+    
+    Returns:
+        Modification time or None if the file doesn't exist
+    """
+    try:
+        return os.path.getmtime(CONFIG_FILE)
+    except OSError:
+        return None
+
 def get_config_value(key: str, default: Any = None) -> Any:
     """
     Get a specific configuration value.
@@ -112,8 +163,31 @@ def get_config_value(key: str, default: Any = None) -> Any:
     Returns:
         Configuration value or default
     """
-    config = load_config()
-    return config.get(key, default)
+    value = _get_cached_config_value(key, _get_mtime())
+    if value is _MISSING:
+        return default
+    
+    # Hand out copies of mutable values so callers cannot alter the cache
+    if isinstance(value, (dict, list)):
+        return copy.deepcopy(value)
+    return value
+
+@functools.lru_cache(maxsize=64)
+def _get_cached_config_value(key: str, mtime: Optional[float]) -> Any:
+    """
+    Read a configuration value from disk, memoized per key and file mtime.
+    
+    Keying on the mtime means edits made to the file outside the app are
+    picked up; save_config() also clears the cache when it writes.
+    
+    Args:
+        key: Configuration key to get
+        mtime: Current modification time of the config file
+        
+    Returns:
+        Configuration value or _MISSING if the key is not present
+    """
+    return load_config().get(key, _MISSING)
 
 def set_config_value(key: str, value: Any) -> bool:
     """
@@ -129,7 +203,8 @@ def set_config_value(key: str, value: Any) -> bool:
     try:
         config = load_config()
         config[key] = value
-        return save_config(config)
+        # Keep an indented, hand-edited file indented
+        return save_config(config, pretty=_file_pretty)
     except Exception as e:
         logger.error(f"Error setting configuration value: {str(e)}")
         return False
\ No newline at end of file
@@ -4,6 +4,7 @@ Handles secure management of user credentials.
 """
 
 import os
+import sys
 import json
 import logging
 import getpass
@@ -12,6 +13,13 @@ from typing import Dict, Any, Optional, List
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Single file holding all credential types, keyed by type
+CREDENTIALS_FILE = ".credentials.json"
+
+# Per-type files used before CREDENTIALS_FILE, merged into it on first read
+LEGACY_CREDENTIALS_FILE = ".{}_credentials.json"
+CREDENTIAL_TYPES = ("zoom", "chatgpt")
+
 class CredentialManager:
     """
     Manages credentials for Zoom and ChatGPT.
@@ -24,6 +32,15 @@ class CredentialManager:
         self.zoom_credentials = None
         self.chatgpt_credentials = None
         
+        # Non-interactive stdin, read once and shared by the prompt methods
+        self._piped_data = None
+        self._piped_lines = None
+        
+        # Cached contents of the credential store and its modification time
+        self._store_cache = None
+        self._store_mtime = None
+        self._legacy_checked = False
+        
         logger.info("CredentialManager initialized")
         
     def prompt_for_zoom_credentials(self) -> Optional[Dict[str, str]]:
@@ -36,6 +53,22 @@ class CredentialManager:
         try:
             logger.info("Prompting for Zoom credentials")
             
+            # Scripted usage: take all values from stdin in one read
+            if not sys.stdin.isatty():
+                credentials = self._read_piped_credentials(
+                    "zoom", ["meeting_id", "passcode", "display_name"]
+                )
+                if not credentials or not credentials.get("meeting_id"):
+                    logger.warning("No Zoom credentials provided on stdin")
+                    return None
+                
+                credentials.setdefault("passcode", "")
+                if not credentials.get("display_name"):
+                    credentials["display_name"] = "Poll Generator"
+                
+                self.zoom_credentials = credentials
+                return credentials
+            
             print("\n=== Zoom Meeting Credentials ===")
             meeting_id = input("Meeting ID: ").strip()
             
@@ -79,6 +112,18 @@ class CredentialManager:
         try:
             logger.info("Prompting for ChatGPT credentials")
             
+            # Scripted usage: take all values from stdin in one read
+            if not sys.stdin.isatty():
+                credentials = self._read_piped_credentials("chatgpt", ["email", "password"])
+                if not credentials or not credentials.get("email"):
+                    logger.warning("No ChatGPT credentials provided on stdin")
+                    return None
+                
+                credentials.setdefault("password", "")
+                
+                self.chatgpt_credentials = credentials
+                return credentials
+            
             print("\n=== ChatGPT Credentials ===")
             email = input("Email: ").strip()
             
@@ -111,6 +156,38 @@ class CredentialManager:
             logger.error(f"Error prompting for ChatGPT credentials: {str(e)}")
             return None
     
+    def _read_piped_credentials(self, credential_type: str, fields: List[str]) -> Optional[Dict[str, str]]:
+        """
+        Read credentials from non-interactive stdin.
+        
+        Stdin is read once and accepts either a JSON object (optionally with
+        per-type sections such as {"zoom": {...}, "chatgpt": {...}}) or
+        newline-separated values in field order, consumed across prompts.
+        
+        Args:
+            credential_type: Type of credentials ('zoom' or 'chatgpt')
+            fields: Field names in the order they appear on stdin
+            
+        Returns:
+            Dict containing the provided fields or None if nothing was provided
+        """
+        if self._piped_data is None and self._piped_lines is None:
+            raw = sys.stdin.read().strip()
+            if raw.startswith("{"):
+                self._piped_data = json.loads(raw)
+            else:
+                self._piped_lines = [line.strip() for line in raw.splitlines()]
+        
+        if self._piped_data is not None:
+            section = self._piped_data.get(credential_type, self._piped_data)
+            credentials = {field: str(section[field]) for field in fields if field in section}
+        else:
+            values = self._piped_lines[:len(fields)]
+            del self._piped_lines[:len(fields)]
+            credentials = dict(zip(fields, values))
+        
+        return credentials or None
+    
     def load_zoom_credentials(self) -> Optional[Dict[str, str]]:
         """
         Load saved Zoom credentials.
@@ -244,6 +321,86 @@ class CredentialManager:
             logger.error(f"Error updating ChatGPT credentials: {str(e)}")
             return False
     
+    def _read_store(self) -> Dict[str, Dict[str, str]]:
+        """
+        Read the credential store, reusing the cached copy while the file is unchanged.
+        
+        Returns:
+            Dict mapping credential type to credentials
+        """
+        if not self._legacy_checked:
+            self._legacy_checked = True
+            self._migrate_legacy_files()
+        
+        try:
+            mtime = os.path.getmtime(CREDENTIALS_FILE)
+        except OSError:
+            self._store_cache = None
+            self._store_mtime = None
+            return {}
+        
+        if self._store_cache is None or mtime != self._store_mtime:
+            with open(CREDENTIALS_FILE, 'r') as f:
+                self._store_cache = json.load(f)
+            self._store_mtime = mtime
+        
+        return self._store_cache
+    
+    def _migrate_legacy_files(self) -> None:
+        """
+        Move credentials from the old per-type files into the credential store.
+        
+        Credentials already in the store take precedence. The old files are
+        deleted once their contents are written to the store, so no
+        plaintext copies are left behind.
+        """
+        legacy_files = [(t, LEGACY_CREDENTIALS_FILE.format(t)) for t in CREDENTIAL_TYPES]
+        legacy_files = [(t, path) for t, path in legacy_files if os.path.exists(path)]
+        if not legacy_files:
+            return
+        
+        try:
+            store = dict(self._read_store())
+            for credential_type, path in legacy_files:
+                with open(path, 'r') as f:
+                    store.setdefault(credential_type, json.load(f))
+            
+            self._write_store(store)
+            for _, path in legacy_files:
+                os.remove(path)
+            
+            logger.info("Migrated saved credentials to the credential store")
+        except Exception as e:
+            logger.error(f"Error migrating old credential files: {str(e)}")
+    
+    def _write_store(self, store: Dict[str, Dict[str, str]]) -> None:
+        """
+        Write the credential store atomically, or remove it if empty.
+        
+        Args:
+            store: Dict mapping credential type to credentials
+        """
+        if not store:
+            if os.path.exists(CREDENTIALS_FILE):
+                os.remove(CREDENTIALS_FILE)
+            self._store_cache = None
+            self._store_mtime = None
+            return
+        
+        temp_file = f"{CREDENTIALS_FILE}.tmp"
+        with open(temp_file, 'w') as f:
+            json.dump(store, f)
+        
+        # Attempt to set restrictive permissions before the file becomes visible
+        try:
+            os.chmod(temp_file, 0o600)  # Read/write for owner only
+        except:
+            logger.warning(f"Could not set restrictive permissions on {CREDENTIALS_FILE}")
+        
+        os.replace(temp_file, CREDENTIALS_FILE)
+        self._store_cache = store
+        self._store_mtime = os.path.getmtime(CREDENTIALS_FILE)
+    
     def _save_credentials(self, credential_type: str, credentials: Dict[str, str]) -> bool:
         """
         Save credentials securely.
@@ -256,17 +413,15 @@ class CredentialManager:
             Boolean indicating whether save was successful
         """
         try:
-            # Use file-based storage
-            cred_file = f".{credential_type}_credentials.json"
-            with open(cred_file, 'w') as f:
-                json.dump(credentials, f)
+            store = dict(self._read_store())
             
-            # Attempt to set restrictive permissions
-            try:
-                os.chmod(cred_file, 0o600)  # Read/write for owner only
-            except:
-                logger.warning(f"Could not set restrictive permissions on {cred_file}")
+            # Skip the write if nothing changed
+            if store.get(credential_type) == credentials:
+                return True
             
+            # Copy so later edits to the caller's dict don't change the cached store
+            store[credential_type] = dict(credentials)
+            self._write_store(store)
             return True
             
         except Exception as e:
@@ -284,14 +439,9 @@ class CredentialManager:
             Dict containing credentials or None if not found
         """
         try:
-            # Use file-based storage
-            cred_file = f".{credential_type}_credentials.json"
-            
-            if os.path.exists(cred_file):
-                with open(cred_file, 'r') as f:
-                    return json.load(f)
-            else:
-                return None
+            credentials = self._read_store().get(credential_type)
+            # Copy so the caller can't change the cached store
+            return dict(credentials) if credentials else None
                 
         except Exception as e:
             logger.error(f"Error loading credentials: {str(e)}")
@@ -308,11 +458,11 @@ class CredentialManager:
             Boolean indicating whether deletion was successful
         """
         try:
-            # Delete from file-based storage
-            cred_file = f".{credential_type}_credentials.json"
+            store = dict(self._read_store())
             
-            if os.path.exists(cred_file):
-                os.remove(cred_file)
+            if credential_type in store:
+                del store[credential_type]
+                self._write_store(store)
             
             return True
             
@@ -1,16 +1,62 @@
-import pyautogui
+import sys
 import time
 
+# mss is a thin ctypes capture wrapper; fall back to Pillow when it's missing
+try:
+    import mss
+except ImportError:
+    mss = None
+    from PIL import ImageGrab
+
+if sys.platform == 'win32':
+    import ctypes
+    from ctypes import wintypes
+
+    def get_position():
+        point = wintypes.POINT()
+        ctypes.windll.user32.GetCursorPos(ctypes.byref(point))
+        return point.x, point.y
+else:
+    # Only needed for the cursor position off Windows
+    import pyautogui
+
+    def get_position():
+        x, y = pyautogui.position()
+        return x, y
+
+
+def get_pixel(screen, x, y):
+    if screen:
+        return screen.grab({'left': x, 'top': y, 'width': 1, 'height': 1}).pixel(0, 0)
+    return ImageGrab.grab(bbox=(x, y, x + 1, y + 1)).getpixel((0, 0))
+
+
 print("Move your mouse to find coordinates.")
 print("Press Ctrl+C to stop.")
 
+screen = mss.mss() if mss else None
+
+write = sys.stdout.write
+flush = sys.stdout.flush
+
 try:
+    last_position = None
     while True:
-        x, y = pyautogui.position()
-        rgb = pyautogui.screenshot().getpixel((x, y))
-        position_str = f'X: {x} Y: {y} RGB: {rgb}'
-        print(position_str, end='')
-        print('\b' * len(position_str), end='', flush=True)
-        time.sleep(0.1)
+        x, y = get_position()
+
+        # Only sample when the mouse moved, and grab just the pixel under it
+        if (x, y) == last_position:
+            time.sleep(0.1)
+            continue
+        last_position = (x, y)
+
+        rgb = get_pixel(screen, x, y)
+        # Fixed width so a shorter line fully overwrites the previous one
+        write(f'\rX: {x:>5} Y: {y:>5} RGB: {str(rgb):<20}')
+        flush()
+        time.sleep(0.05)
 except KeyboardInterrupt:
-    print('\n\nDone! Coordinates captured.')
\ No newline at end of file
+    print('\n\nDone! Coordinates captured.')
+finally:
+    if screen:
+        screen.close()
@@ -3,18 +3,15 @@ GUI Module for the Automated Zoom Poll Generator.
 Provides a simple user interface for monitoring and controlling the application.
 """
 
+import queue
+import time
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import threading
-import time
-import datetime
 from typing import Callable, Dict, Optional
 
 from logger import get_logger, export_log_file
 from config import APP_NAME, APP_VERSION
 
-logger = get_logger()
-
 
 class ApplicationGUI:
     """
@@ -28,25 +25,49 @@ class ApplicationGUI:
         Args:
             callbacks: Dict of callback functions for various actions
         """
+        # Configured on first use rather than at import
+        self.log = get_logger()
+        
         self.root = None
         self.status_var = None
         self.log_text = None
         self.scheduler_status_var = None
         self.next_capture_var = None
         self.next_poll_var = None
+        self.follow_tail_var = None
+        
+        # Log display is capped so inserts stay cheap on long runs
+        self.max_log_lines = 2000
+        self.log_line_count = 0
+        
+        # Log messages from any thread, drained in batches on the UI thread
+        self.log_queue = queue.Queue()
+        self.max_log_batch = 200
+        self._log_after_id = None
         
         # Callbacks for various actions
         self.callbacks = callbacks or {}
         
-        # Status update thread
-        self.update_thread = None
-        self.keep_updating = False
+        # Pending Tk after() jobs for status polling and the status bar clock
+        self._after_id = None
+        self._clock_after_id = None
         
-        logger.info("GUI module initialized")
+        self.log.info("GUI module initialized")
     
     def create_window(self):
         """Create the main application window."""
-        logger.info("Creating main application window")
+        self.log.info("Creating main application window")
+        
+        # Make sure a previous window's periodic jobs don't keep running
+        self._cancel_periodic_jobs()
+        
+        # Replace any previous window, whose log lines go with it
+        if self.root:
+            try:
+                self.root.destroy()
+            except tk.TclError:
+                pass  # Window already destroyed
+        self.log_line_count = 0
         
         # Create main window
         self.root = tk.Tk()
@@ -158,13 +179,34 @@ class ApplicationGUI:
         log_frame.rowconfigure(0, weight=1)
         
         # Create log text widget with scrollbar
-        self.log_text = tk.Text(log_frame, wrap=tk.WORD, height=15)
+        # No wrapping or undo history: lines never need re-breaking on insert
+        self.log_text = tk.Text(
+            log_frame,
+            wrap="none",
+            height=15,
+            undo=False,
+            maxundo=0,
+            autoseparators=False,
+            state="disabled"
+        )
         self.log_text.grid(row=0, column=0, sticky="nsew")
         
         scrollbar = ttk.Scrollbar(log_frame, orient="vertical", command=self.log_text.yview)
         scrollbar.grid(row=0, column=1, sticky="ns")
         self.log_text.config(yscrollcommand=scrollbar.set)
         
+        hscrollbar = ttk.Scrollbar(log_frame, orient="horizontal", command=self.log_text.xview)
+        hscrollbar.grid(row=1, column=0, sticky="ew")
+        self.log_text.config(xscrollcommand=hscrollbar.set)
+        
+        # Always scroll to new entries, even when scrolled up
+        self.follow_tail_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(
+            log_frame,
+            text="Follow tail",
+            variable=self.follow_tail_var
+        ).grid(row=2, column=0, sticky="w", pady=(5, 0))
+        
         # Bottom status bar
         status_bar = ttk.Frame(self.root, relief=tk.SUNKEN, padding=(2, 2))
         status_bar.grid(row=4, column=0, sticky="ew")
@@ -182,27 +224,81 @@ class ApplicationGUI:
             font=("Helvetica", 8)
         ).pack(side="right", padx=5)
         
-        # Update time every second
+        # Update time every second, aligned to the wall-clock second
+        last_time_str = None
+        
         def update_time():
-            time_var.set(datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
-            self.root.after(1000, update_time)
+            nonlocal last_time_str
+            now = time.time()
+            time_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+            if time_str != last_time_str:
+                time_var.set(time_str)
+                last_time_str = time_str
+            self._clock_after_id = self.root.after(1000 - int(now * 1000) % 1000, update_time)
         
         update_time()
         
-        # Start update thread
-        self.start_update_thread()
+        # Start polling scheduler status and draining logs on the UI thread
+        self._poll_status()
+        self._drain_log()
         
-        logger.info("GUI window created")
+        self.log.info("GUI window created")
     
     def update_log_display(self, text):
         """
-        Update the log display with new text.
+        Queue text for the log display. Safe to call from any thread.
         
         Args:
             text: Text to append to the log display
         """
-        if self.log_text:
-            self.log_text.insert(tk.END, f"{text}\n")
+        self.log_queue.put_nowait(text)
+    
+    def _drain_log(self):
+        """Move queued log messages into the log display in a single insert."""
+        lines = []
+        try:
+            while len(lines) < self.max_log_batch:
+                lines.append(self.log_queue.get_nowait())
+        except queue.Empty:
+            pass
+        
+        if lines:
+            self._append_log_lines(lines)
+        
+        self._log_after_id = self.root.after(100, self._drain_log)
+    
+    def _append_log_lines(self, lines):
+        """
+        Append lines to the log display, trimming the oldest beyond the cap.
+        
+        Args:
+            lines: List of log messages to append
+        """
+        if not self.log_text:
+            return
+        
+        # Only follow the tail if the user is already at the bottom
+        at_bottom = self.log_text.yview()[1] > 0.999
+        
+        # The widget is read-only between batches
+        self.log_text.configure(state="normal")
+        
+        blob = "\n".join(lines)
+        self.log_text.insert(tk.END, f"{blob}\n")
+        self.log_line_count += blob.count("\n") + 1
+        
+        # Drop the oldest lines once over the cap, keeping the scroll position
+        excess = self.log_line_count - self.max_log_lines
+        if excess > 0:
+            first_visible = self.log_text.yview()[0]
+            self.log_text.delete("1.0", f"{excess + 1}.0")
+            self.log_line_count -= excess
+            if not at_bottom:
+                self.log_text.yview_moveto(first_visible)
+        
+        self.log_text.configure(state="disabled")
+        
+        if at_bottom or self.follow_tail_var.get():
             self.log_text.see(tk.END)  # Scroll to the end
     
     def update_status(self, text):
@@ -246,58 +342,62 @@ class ApplicationGUI:
         else:
             self.next_poll_var.set("Not scheduled")
     
-    def start_update_thread(self):
-        """Start the background thread for updating status information."""
-        self.keep_updating = True
-        self.update_thread = threading.Thread(target=self._update_loop)
-        self.update_thread.daemon = True
-        self.update_thread.start()
+    def _poll_status(self):
+        """Poll scheduler status on the Tk event loop, once per second."""
+        # Update status if callback is provided
+        if "get_status" in self.callbacks:
+            try:
+                status = self.callbacks["get_status"]()
+                self.update_scheduler_status(status)
+            except Exception:
+                self.log.exception("Error updating status")
+        
+        self._after_id = self.root.after(1000, self._poll_status)
     
-    def _update_loop(self):
-        """Background loop for updating status information."""
-        while self.keep_updating:
-            # Update status if callback is provided
-            if "get_status" in self.callbacks:
+    def _cancel_periodic_jobs(self):
+        """Cancel the status polling, log draining and clock jobs if scheduled."""
+        for after_id in (self._after_id, self._log_after_id, self._clock_after_id):
+            if after_id:
                 try:
-                    status = self.callbacks["get_status"]()
-                    self.root.after(0, lambda: self.update_scheduler_status(status))
-                except Exception as e:
-                    logger.error(f"Error updating status: {str(e)}")
-            
-            # Sleep before next update
-            time.sleep(1)
+                    self.root.after_cancel(after_id)
+                except tk.TclError:
+                    pass  # Window already destroyed
+        
+        self._after_id = None
+        self._log_after_id = None
+        self._clock_after_id = None
     
     def on_start_click(self):
         """Handle Start button click."""
-        logger.info("Start button clicked")
+        self.log.info("Start button clicked")
         if "start" in self.callbacks:
             self.callbacks["start"]()
             self.update_status("Running")
     
     def on_stop_click(self):
         """Handle Stop button click."""
-        logger.info("Stop button clicked")
+        self.log.info("Stop button clicked")
         if "stop" in self.callbacks:
             self.callbacks["stop"]()
             self.update_status("Stopped")
     
     def on_capture_click(self):
         """Handle Capture Now button click."""
-        logger.info("Capture Now button clicked")
+        self.log.info("Capture Now button clicked")
         if "capture" in self.callbacks:
             self.update_status("Capturing transcript...")
             self.callbacks["capture"]()
     
     def on_generate_poll_click(self):
         """Handle Generate Poll button click."""
-        logger.info("Generate Poll button clicked")
+        self.log.info("Generate Poll button clicked")
         if "generate_poll" in self.callbacks:
             self.update_status("Generating poll...")
             self.callbacks["generate_poll"]()
     
     def on_export_log_click(self):
         """Handle Export Log button click."""
-        logger.info("Export Log button clicked")
+        self.log.info("Export Log button clicked")
         try:
             file_path = filedialog.asksaveasfilename(
                 defaultextension=".txt",
@@ -318,7 +418,7 @@ class ApplicationGUI:
                         "Failed to export log file."
                     )
         except Exception as e:
-            logger.error(f"Error exporting log: {str(e)}")
+            self.log.error("Error exporting log: %s", e)
             messagebox.showerror(
                 "Export Error", 
                 f"An error occurred while exporting the log:\n{str(e)}"
@@ -326,7 +426,7 @@ class ApplicationGUI:
     
     def on_close(self):
         """Handle window close event."""
-        logger.info("Application window closing")
+        self.log.info("Application window closing")
         
         # Ask user to confirm
         confirm = messagebox.askyesno(
@@ -335,10 +435,8 @@ class ApplicationGUI:
         )
         
         if confirm:
-            # Stop update thread
-            self.keep_updating = False
-            if self.update_thread and self.update_thread.is_alive():
-                self.update_thread.join(1)
+            # Stop status polling and log draining
+            self._cancel_periodic_jobs()
             
             # Call stop callback if provided
             if "stop" in self.callbacks:
@@ -356,5 +454,5 @@ class ApplicationGUI:
         if not self.root:
             self.create_window()
         
-        logger.info("Starting GUI main loop")
+        self.log.info("Starting GUI main loop")
         self.root.mainloop()
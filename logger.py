@@ -4,8 +4,13 @@ Provides consistent logging throughout the application.
 """
 
 import os
+import sys
+import queue
+import atexit
+import shutil
 import logging
 import logging.handlers
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -16,62 +21,115 @@ LOG_FILE = "app.log"
 LOG_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
 LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 LOG_LEVEL = logging.DEBUG  # Default to DEBUG level
-MAX_LOG_SIZE = 5 * 1024 * 1024  # 5 MB
-LOG_BACKUP_COUNT = 3  # Keep 3 backup logs
+LOG_ROTATE_WHEN = "midnight"  # Start a new log file each day (UTC)
+LOG_BACKUP_COUNT = 7  # Keep a week of daily logs
 
-# Create logs directory if it doesn't exist
-os.makedirs(LOG_FOLDER, exist_ok=True)
+# Handlers shared by every configured logger, created once
+_handlers = None
+_handlers_lock = threading.Lock()
 
-def get_logger(name: Optional[str] = None) -> logging.Logger:
+# Background listener that formats and writes queued records
+_listener = None
+
+def _get_handlers() -> list:
     """
-    Get a configured logger instance.
+    Get the shared handlers, creating them on first use.
+    
+    Loggers only get a QueueHandler; the file and console handlers run on a
+    QueueListener thread so logging calls never block on disk I/O.
+    
+    Must be called with _handlers_lock held.
     
-    Args:
-        name: Optional name for the logger (defaults to root logger)
-        
     Returns:
-        Configured logger instance
+        List of configured handlers
     """
-    # Get the logger
-    logger = logging.getLogger(name)
+    global _handlers, _listener
     
-    # Only configure the logger if it hasn't been configured yet
-    if not logger.handlers:
-        # Set the log level
-        logger.setLevel(LOG_LEVEL)
+    if _handlers is None:
+        # Create logs directory if it doesn't exist
+        os.makedirs(LOG_FOLDER, exist_ok=True)
         
         # Create a formatter
         formatter = logging.Formatter(LOG_FORMAT, LOG_DATE_FORMAT)
         
-        # Create a rotating file handler
+        # Create a daily rotating file handler (rotated files are app.log.YYYY-MM-DD)
         log_path = os.path.join(LOG_FOLDER, LOG_FILE)
-        file_handler = logging.handlers.RotatingFileHandler(
+        file_handler = logging.handlers.TimedRotatingFileHandler(
             log_path,
-            maxBytes=MAX_LOG_SIZE,
-            backupCount=LOG_BACKUP_COUNT
+            when=LOG_ROTATE_WHEN,
+            backupCount=LOG_BACKUP_COUNT,
+            encoding='utf-8',
+            utc=True
         )
         file_handler.setFormatter(formatter)
         file_handler.setLevel(LOG_LEVEL)
         
-        # Create a console handler
-        console_handler = logging.StreamHandler()
-        console_handler.setFormatter(formatter)
-        console_handler.setLevel(logging.INFO)  # Console shows INFO and above
+        output_handlers = [file_handler]
+        
+        # Only log to the console when someone is watching it
+        if sys.stderr.isatty():
+            console_handler = logging.StreamHandler()
+            console_handler.setFormatter(formatter)
+            console_handler.setLevel(logging.WARNING)  # Console shows WARNING and above
+            output_handlers.append(console_handler)
         
-        # Add handlers to the logger
-        logger.addHandler(file_handler)
-        logger.addHandler(console_handler)
+        # Hand records to a background thread for formatting and writing
+        log_queue = queue.Queue(-1)
+        _listener = logging.handlers.QueueListener(
+            log_queue,
+            *output_handlers,
+            respect_handler_level=True
+        )
+        _listener.start()
+        atexit.register(_listener.stop)
+        
+        _handlers = [logging.handlers.QueueHandler(log_queue)]
+    
+    return _handlers
+
+def get_logger(name: Optional[str] = None) -> logging.Logger:
+    """
+    Get a configured logger instance.
+    
+    Args:
+        name: Optional name for the logger (defaults to root logger)
         
-        logger.debug("Logger initialized")
+    Returns:
+        Configured logger instance
+    """
+    # Get the logger
+    logger = logging.getLogger(name)
+    
+    # Only configure the logger if it hasn't been configured yet
+    if getattr(logger, "_configured", False):
+        return logger
+    
+    with _handlers_lock:
+        if not getattr(logger, "_configured", False):
+            # Set the log level
+            logger.setLevel(LOG_LEVEL)
+            
+            # Attach the shared handlers so each record is written once
+            for handler in _get_handlers():
+                if handler not in logger.handlers:
+                    logger.addHandler(handler)
+            
+            # Don't pass records on to the root logger's handlers as well
+            logger.propagate = False
+            logger._configured = True
+            
+            logger.debug("Logger initialized")
     
     return logger
 
-def export_logs(output_file: Optional[str] = None) -> str:
+def export_logs(output_file: Optional[str] = None, date: Optional[str] = None) -> str:
     """
     Export logs to a text file.
     
     Args:
         output_file: Optional file path for the exported logs
+        date: Optional UTC day (YYYY-MM-DD) of a rotated log to export
+              instead of the current log
         
     Returns:
         Path to the exported log file
@@ -81,29 +139,30 @@ def export_logs(output_file: Optional[str] = None) -> str:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         output_file = f"exported_logs_{timestamp}.txt"
     
-    # Get the log file path
+    # Get the log file path; rotated days are stored as app.log.YYYY-MM-DD
     log_path = os.path.join(LOG_FOLDER, LOG_FILE)
+    if date:
+        log_path = f"{log_path}.{date}"
     
     # Check if log file exists
     if not os.path.exists(log_path):
-        get_logger().warning(f"Log file does not exist: {log_path}")
+        get_logger().warning("Log file does not exist: %s", log_path)
         return ""
     
     try:
-        # Copy the log file to the output file
-        with open(log_path, 'r', encoding='utf-8') as log_file:
-            log_content = log_file.read()
-        
-        with open(output_file, 'w', encoding='utf-8') as output:
-            output.write(log_content)
+        # Copy the log file to the output file without loading it into memory
+        shutil.copyfile(log_path, output_file)
         
-        get_logger().info(f"Logs exported to {output_file}")
+        get_logger().info("Logs exported to %s", output_file)
         return output_file
         
     except Exception as e:
-        get_logger().error(f"Failed to export logs: {str(e)}")
+        get_logger().error("Failed to export logs: %s", e)
         return ""
 
+# Name used by the GUI front ends
+export_log_file = export_logs
+
 def clear_logs() -> bool:
     """
     Clear the log file.
@@ -122,12 +181,5 @@ def clear_logs() -> bool:
         return True
         
     except Exception as e:
-        get_logger().error(f"Failed to clear logs: {str(e)}")
+        get_logger().error("Failed to clear logs: %s", e)
         return False
-
-# Configure basic logging for import time
-logging.basicConfig(
-    format=LOG_FORMAT,
-    datefmt=LOG_DATE_FORMAT,
-    level=LOG_LEVEL
-)
\ No newline at end of file
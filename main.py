@@ -4,57 +4,86 @@ Main entry point for the Automated Zoom Poll Generator.
 
 import os
 import sys
-import time
+import atexit
 import signal
-import logging
+import hashlib
 import argparse
-import tkinter as tk
-from tkinter import ttk, messagebox
-from typing import Dict, List, Any, Optional
+import threading
+from functools import partial, lru_cache, wraps
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional
 
-# Configure basic logging before imports
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
+from logger import get_logger
 
-# Import the Flask app for gunicorn
-from app import app
+# Configure logging before imports. The root logger gets the shared handlers
+# so records from the component modules' loggers reach the log file too.
+get_logger()
+logger = get_logger(__name__)
 
-# Import application modules
-try:
-    from dotenv import load_dotenv
-    
-    # Import core modules
-    from logger import get_logger
-    from config import load_config, save_config
-    from transcript_capture import create_transcript_capture
-    from chatgpt_integration import create_chatgpt_integration
-    from poll_posting import create_poll_posting
-    from zoom_automation import create_zoom_automation
-    from scheduler import create_scheduler
-    from credential_manager import create_credential_manager
-    
-except ImportError as e:
-    logger.error(f"Failed to import required modules: {e}")
-    logger.error("Please install required packages using pip install -r requirements.txt")
-    sys.exit(1)
+# The component modules pull in Selenium, pyautogui and APScheduler, and
+# tkinter is only needed for the desktop dialogs, so all of them are imported
+# where they are used rather than here.
+
+# Characters of already-used transcript sent along with new content for context
+TRANSCRIPT_CONTEXT_CHARS = 500
 
-# Load environment variables from .env file if it exists
-load_dotenv()
+# Lowercased process names of the Zoom client and its helpers
+ZOOM_PROCESS_NAMES = frozenset({
+    "zoom", "zoom.exe", "zoom.us", "zoomlauncher",
+    "zoomwebviewhost.exe", "cpthost", "cpthost.exe", "airhost.exe"
+})
 
-# Global variables
-transcript_capture = None
-chatgpt_integration = None
-poll_posting = None
-zoom_automation = None
-scheduler = None
-credential_manager = None
-config = None
-recent_transcript = None
-current_poll = None
-session_active = False
+@dataclass(slots=True)
+class SessionState:
+    """
+    Components and per-session data shared by the scheduled tasks.
+    Fields written from scheduler threads are updated under lock.
+    """
+    transcript_capture: Any = None
+    chatgpt_integration: Any = None
+    poll_posting: Any = None
+    zoom_automation: Any = None
+    scheduler: Any = None
+    credential_manager: Any = None
+    poll_cache: Any = None
+    config: Optional[Dict[str, Any]] = None
+    # ID of the joined meeting, used to create polls through the Zoom API
+    meeting_id: Optional[str] = None
+    recent_transcript: Optional[str] = None
+    current_poll: Optional[Dict[str, Any]] = None
+    # Hash of the transcript that produced current_poll
+    last_transcript_hash: Optional[str] = None
+    # Length of the transcript when the last poll was generated from it
+    transcript_offset: int = 0
+    active: bool = False
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+# Application state
+state = SessionState()
+
+# Set by signal_handler to stop the main loop
+_shutdown = threading.Event()
+
+# Hidden Tk root shared by all dialogs, created on first use
+_tk_root = None
+
+def __getattr__(name: str):
+    """
+    Import the Flask app for gunicorn (main:app) only when it is requested,
+    so the desktop entry point doesn't load the web demo.
+    """
+    if name == "app":
+        _load_env()
+        from app import app
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 class CredentialsDialog:
     def __init__(self, parent):
+        import tkinter as tk
+        from tkinter import ttk
+        
         self.result = None
         
         # Create dialog window
@@ -97,6 +126,7 @@ class CredentialsDialog:
 
     def on_join(self):
         if not self.meeting_id.get() or not self.passcode.get():
+            from tkinter import messagebox
             messagebox.showerror("Error", "Please enter both Meeting ID and Passcode")
             return
             
@@ -110,93 +140,194 @@ class CredentialsDialog:
     def on_cancel(self):
         self.dialog.destroy()
 
+@lru_cache(maxsize=1)
+def _load_env() -> None:
+    """Load environment variables from the .env file, if it exists, once."""
+    from dotenv import load_dotenv
+    load_dotenv()
+
+def _get_root():
+    """
+    Get the hidden Tk root, creating it on first use.
+    Starting Tk is slow, so the root is kept for later dialogs.
+    
+    Returns:
+        The shared Tk root window
+    """
+    global _tk_root
+    
+    if _tk_root is None:
+        import tkinter as tk
+        _tk_root = tk.Tk()
+        _tk_root.withdraw()  # Hide the main window
+        atexit.register(_destroy_root)
+    
+    return _tk_root
+
+def _destroy_root():
+    """Destroy the shared Tk root at exit."""
+    global _tk_root
+    
+    if _tk_root is not None:
+        from tkinter import TclError
+        try:
+            _tk_root.destroy()
+        except TclError:
+            pass
+        _tk_root = None
+
 def prompt_credentials():
     """Prompt for Zoom meeting credentials using a GUI dialog."""
-    root = tk.Tk()
-    root.withdraw()  # Hide the main window
+    root = _get_root()
     
     dialog = CredentialsDialog(root)
     root.wait_window(dialog.dialog)
     
-    root.destroy()
     return dialog.result
 
-def initialize() -> bool:
-    """Initialize the application."""
-    global transcript_capture, chatgpt_integration, poll_posting, zoom_automation, scheduler, credential_manager, config, session_active
+def initialize(state: SessionState) -> bool:
+    """
+    Initialize the application.
+    
+    Args:
+        state: Session state to populate with component instances
+        
+    Returns:
+        Boolean indicating whether initialization was successful
+    """
+    try:
+        _load_env()
+        from config import load_config, save_config
+        from transcript_capture import create_transcript_capture
+        from chatgpt_integration import create_chatgpt_integration
+        from poll_posting import create_poll_posting
+        from zoom_automation import create_zoom_automation
+        from scheduler import create_scheduler
+        from credential_manager import create_credential_manager
+        from poll_cache import create_poll_cache
+        
+    except ImportError as e:
+        logger.error("Failed to import required modules: %s", e)
+        logger.error("Please install required packages using pip install -r requirements.txt")
+        return False
     
     try:
-        logger.debug("Logger initialized")
         logger.info("Initializing application")
         
         # Load configuration with desktop client type
         config = load_config()
-        config["zoom_client_type"] = "desktop"  # Force desktop client type
-        save_config(config)
+        
+        # Force desktop client type, writing the file only if it changes
+        dirty = False
+        if config.get("zoom_client_type") != "desktop":
+            config["zoom_client_type"] = "desktop"
+            dirty = True
+        
+        if dirty:
+            save_config(config, pretty=True)
+        
+        # Create the transcripts folder once; the config doesn't change at runtime
+        if config.get("save_transcripts"):
+            os.makedirs(config["transcripts_folder"], exist_ok=True)
         
         # Create component instances
         client_type = "desktop"  # Force desktop client type
-        logger.info(f"Using Zoom client type: {client_type}")
+        logger.info("Using Zoom client type: %s", client_type)
         
-        transcript_capture = create_transcript_capture(client_type=client_type)
-        chatgpt_integration = create_chatgpt_integration()
-        poll_posting = create_poll_posting(client_type=client_type)
-        zoom_automation = create_zoom_automation(client_type=client_type)
-        scheduler = create_scheduler(use_simple_scheduler=False)
-        credential_manager = create_credential_manager()
+        state.config = config
+        state.transcript_capture = create_transcript_capture(client_type=client_type)
+        state.chatgpt_integration = create_chatgpt_integration()
+        state.poll_posting = create_poll_posting(client_type=client_type)
+        state.zoom_automation = create_zoom_automation(client_type=client_type)
+        state.scheduler = create_scheduler(use_simple_scheduler=False)
+        state.credential_manager = create_credential_manager()
+        state.poll_cache = create_poll_cache()
         
         # Set up signal handling
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
+        signal.signal(signal.SIGINT, partial(signal_handler, state))
+        signal.signal(signal.SIGTERM, partial(signal_handler, state))
         
         logger.info("Application initialized successfully")
         return True
         
     except Exception as e:
-        logger.error(f"Failed to initialize application: {str(e)}")
+        logger.error("Failed to initialize application: %s", e)
         return False
 
-def capture_transcript_task() -> Optional[str]:
+def _task(name: str, failure_result: Any = None):
+    """
+    Decorate a task or session function so any unexpected error is logged
+    with its traceback instead of propagating.
+    
+    Args:
+        name: Description of the task used in the log message
+        failure_result: Value returned when the function raises
+        
+    Returns:
+        Decorator for the function
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            except Exception:
+                logger.exception("Error in %s", name)
+                return failure_result
+        return wrapper
+    return decorator
+
+@_task("transcript capture task", None)
+def capture_transcript_task(state: SessionState) -> Optional[str]:
     """
     Task to capture transcript from Zoom.
     This function is called by the scheduler.
     
+    Args:
+        state: Current session state
+        
     Returns:
         The captured transcript or None if capture failed
     """
-    global recent_transcript
-    
     logger.info("Executing scheduled transcript capture")
     
-    try:
-        # Capture transcript
-        transcript = transcript_capture.capture_transcript()
-        
-        if transcript:
-            recent_transcript = transcript
-            logger.info(f"Transcript captured successfully ({len(transcript)} characters)")
-            
-            # Generate poll immediately after capturing transcript
-            generate_poll_task()
-            
-            return transcript
-        else:
-            logger.warning("Failed to capture transcript")
-            return None
-            
-    except Exception as e:
-        logger.error(f"Error in transcript capture task: {str(e)}")
+    # Capture transcript
+    transcript = state.transcript_capture.capture_transcript()
+    
+    if transcript:
+        with state.lock:
+            state.recent_transcript = transcript
+        logger.info("Transcript captured successfully (%d characters)", len(transcript))
+        
+        # Generate poll immediately after capturing transcript, unless
+        # the transcript is unchanged since the current poll was made
+        transcript_hash = hashlib.blake2b(transcript.encode("utf-8"), digest_size=16).hexdigest()
+        if transcript_hash == state.last_transcript_hash and state.current_poll:
+            logger.info("Transcript unchanged, reused cached poll")
+        elif generate_poll_task(state):
+            with state.lock:
+                state.last_transcript_hash = transcript_hash
+        
+        return transcript
+    else:
+        logger.warning("Failed to capture transcript")
         return None
 
-def generate_poll_task() -> Optional[Dict[str, Any]]:
+@_task("poll generation task", None)
+def generate_poll_task(state: SessionState) -> Optional[Dict[str, Any]]:
     """
     Task to generate a poll from the recent transcript.
     This function can be called directly or after transcript capture.
     
+    Args:
+        state: Current session state
+        
     Returns:
         Dictionary containing poll data or None if generation failed
     """
-    global recent_transcript, current_poll
+    with state.lock:
+        recent_transcript = state.recent_transcript
+        offset = state.transcript_offset
     
     if not recent_transcript:
         logger.warning("No transcript available for poll generation")
@@ -204,31 +335,51 @@ def generate_poll_task() -> Optional[Dict[str, Any]]:
     
     logger.info("Generating poll from transcript")
     
-    try:
-        # Generate poll using ChatGPT
-        poll_data = chatgpt_integration.generate_poll_with_chatgpt(recent_transcript)
-        
-        if poll_data:
-            current_poll = poll_data
-            logger.info(f"Poll generated successfully: {poll_data['question']}")
-            return poll_data
-        else:
-            logger.warning("Failed to generate poll")
-            return None
-            
-    except Exception as e:
-        logger.error(f"Error in poll generation task: {str(e)}")
+    # The captured transcript accumulates over the meeting, so only send
+    # what was added since the last poll plus a short tail for context.
+    # A shorter transcript means the panel was reset; start over.
+    if offset > len(recent_transcript):
+        offset = 0
+    new_text = recent_transcript[max(0, offset - TRANSCRIPT_CONTEXT_CHARS):]
+    
+    # Reuse a poll generated earlier for the same transcript and prompt
+    cache_key = state.poll_cache.make_key(new_text, state.chatgpt_integration.prompt_template)
+    poll_data = state.poll_cache.get(cache_key)
+    if poll_data:
+        with state.lock:
+            state.current_poll = poll_data
+            state.transcript_offset = len(recent_transcript)
+        logger.info("Reused cached poll: %s", poll_data['question'])
+        return poll_data
+    
+    # Generate poll using ChatGPT
+    poll_data = state.chatgpt_integration.generate_poll_with_chatgpt(new_text)
+    
+    if poll_data:
+        with state.lock:
+            state.current_poll = poll_data
+            state.transcript_offset = len(recent_transcript)
+        state.poll_cache.set(cache_key, poll_data)
+        logger.info("Poll generated successfully: %s", poll_data['question'])
+        return poll_data
+    else:
+        logger.warning("Failed to generate poll")
         return None
 
-def post_poll_task() -> bool:
+@_task("poll posting task", False)
+def post_poll_task(state: SessionState) -> bool:
     """
     Task to post the current poll to Zoom.
     This function is called by the scheduler.
     
+    Args:
+        state: Current session state
+        
     Returns:
         Boolean indicating whether posting was successful
     """
-    global current_poll
+    with state.lock:
+        current_poll = state.current_poll
     
     if not current_poll:
         logger.warning("No poll available to post")
@@ -236,148 +387,198 @@ def post_poll_task() -> bool:
     
     logger.info("Posting poll to Zoom")
     
-    try:
-        # Post poll to Zoom
-        result = poll_posting.post_poll_to_zoom(current_poll)
-        
-        if result:
-            logger.info("Poll posted successfully")
-            return True
-        else:
-            logger.warning("Failed to post poll")
-            return False
-            
-    except Exception as e:
-        logger.error(f"Error in poll posting task: {str(e)}")
+    # Post poll to Zoom
+    result = state.poll_posting.post_poll_to_zoom(current_poll, state.meeting_id)
+    
+    if result:
+        logger.info("Poll posted successfully")
+        return True
+    else:
+        logger.warning("Failed to post poll")
         return False
 
-def start_session() -> bool:
+def _start_chatgpt(state: SessionState, chatgpt_credentials: Dict[str, str]) -> bool:
+    """
+    Open the ChatGPT browser and log in.
+    
+    Args:
+        state: Current session state
+        chatgpt_credentials: Dict containing ChatGPT credentials
+        
+    Returns:
+        Boolean indicating whether ChatGPT is ready for use
+    """
+    # Initialize browser for ChatGPT
+    if not state.chatgpt_integration.initialize_browser():
+        logger.error("Failed to initialize browser for ChatGPT")
+        return False
+    
+    # Login to ChatGPT
+    if not state.chatgpt_integration.login_to_chatgpt(chatgpt_credentials):
+        logger.error("Failed to log in to ChatGPT")
+        return False
+    
+    return True
+
+def _join_zoom(state: SessionState, zoom_credentials: Dict[str, str]) -> bool:
+    """
+    Join the Zoom meeting.
+    
+    Args:
+        state: Current session state
+        zoom_credentials: Dict containing Zoom meeting credentials
+        
+    Returns:
+        Boolean indicating whether the meeting was joined
+    """
+    if not state.zoom_automation.join_meeting(
+        zoom_credentials["meeting_id"],
+        zoom_credentials["passcode"],
+        zoom_credentials.get("display_name", "Poll Generator")
+    ):
+        logger.error("Failed to join Zoom meeting")
+        return False
+    
+    state.meeting_id = zoom_credentials["meeting_id"]
+    return True
+
+@_task("session start", False)
+def start_session(state: SessionState, zoom_credentials: Optional[Dict[str, str]] = None) -> bool:
     """
     Start a new poll generation session.
     
+    Args:
+        state: Current session state
+        zoom_credentials: Zoom meeting credentials to join with (default: load
+            saved credentials or prompt for them)
+        
     Returns:
         Boolean indicating whether session start was successful
     """
-    global session_active
-    
-    if session_active:
+    if state.active:
         logger.warning("Session is already active")
         return True
     
     logger.info("Starting new session")
     
-    try:
-        # Check if Zoom credentials are available
+    # Bind the components and settings used below once
+    config = state.config
+    credential_manager = state.credential_manager
+    zoom_automation = state.zoom_automation
+    scheduler = state.scheduler
+    auto_enable_captions = config.get("auto_enable_captions", True)
+    transcript_interval = config.get("transcript_interval", 10)  # minutes
+    poll_interval = config.get("poll_interval", 15)  # minutes
+    
+    # Check if Zoom credentials are available
+    if not zoom_credentials:
         zoom_credentials = credential_manager.load_zoom_credentials()
+    if not zoom_credentials:
+        zoom_credentials = credential_manager.prompt_for_zoom_credentials()
         if not zoom_credentials:
-            zoom_credentials = credential_manager.prompt_for_zoom_credentials()
-            if not zoom_credentials:
-                logger.error("Zoom credentials are required to start a session")
-                return False
-        
-        # Check if ChatGPT credentials are available
-        chatgpt_credentials = credential_manager.load_chatgpt_credentials()
-        if not chatgpt_credentials:
-            chatgpt_credentials = credential_manager.prompt_for_chatgpt_credentials()
-            if not chatgpt_credentials:
-                logger.error("ChatGPT credentials are required to start a session")
-                return False
-        
-        # Initialize browser for ChatGPT
-        if not chatgpt_integration.initialize_browser():
-            logger.error("Failed to initialize browser for ChatGPT")
-            return False
-        
-        # Login to ChatGPT
-        if not chatgpt_integration.login_to_chatgpt(chatgpt_credentials):
-            logger.error("Failed to log in to ChatGPT")
+            logger.error("Zoom credentials are required to start a session")
             return False
-        
-        # Join Zoom meeting
-        if not zoom_automation.join_meeting(
-            zoom_credentials["meeting_id"],
-            zoom_credentials["passcode"],
-            zoom_credentials.get("display_name", "Poll Generator")
-        ):
-            logger.error("Failed to join Zoom meeting")
+    
+    # Check if ChatGPT credentials are available
+    chatgpt_credentials = credential_manager.load_chatgpt_credentials()
+    if not chatgpt_credentials:
+        chatgpt_credentials = credential_manager.prompt_for_chatgpt_credentials()
+        if not chatgpt_credentials:
+            logger.error("ChatGPT credentials are required to start a session")
             return False
-        
-        # Enable closed captioning if configured
-        if config.get("auto_enable_captions", True):
-            if not zoom_automation.enable_closed_captioning():
-                logger.warning("Failed to enable closed captioning")
-        
-        # Start the scheduler
-        if not scheduler.start():
-            logger.error("Failed to start scheduler")
+    
+    if zoom_automation.client_type == "desktop":
+        # Desktop joining drives the real mouse and keyboard, so the
+        # ChatGPT browser window must not open and take focus meanwhile
+        if not _start_chatgpt(state, chatgpt_credentials):
             return False
-        
-        # Schedule regular transcript captures
-        transcript_interval = config.get("transcript_interval", 10)  # minutes
-        if not scheduler.schedule_transcript_capture(capture_transcript_task, transcript_interval):
-            logger.error("Failed to schedule transcript captures")
+        if not _join_zoom(state, zoom_credentials):
             return False
-        
-        # Schedule regular poll postings
-        poll_interval = config.get("poll_interval", 15)  # minutes
-        if not scheduler.schedule_poll_posting(post_poll_task, poll_interval):
-            logger.error("Failed to schedule poll postings")
+    else:
+        # ChatGPT and the Zoom web client use separate browser sessions,
+        # so start both at once
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            chatgpt_future = executor.submit(_start_chatgpt, state, chatgpt_credentials)
+            zoom_future = executor.submit(_join_zoom, state, zoom_credentials)
+            chatgpt_ready = chatgpt_future.result()
+            zoom_joined = zoom_future.result()
+        
+        if not (chatgpt_ready and zoom_joined):
             return False
-        
-        session_active = True
-        logger.info(f"Session started successfully - capturing transcripts every {transcript_interval} minutes and posting polls every {poll_interval} minutes")
-        return True
-        
-    except Exception as e:
-        logger.error(f"Error starting session: {str(e)}")
+    
+    # Enable closed captioning if configured
+    if auto_enable_captions:
+        if not zoom_automation.enable_closed_captioning():
+            logger.warning("Failed to enable closed captioning")
+    
+    # Start the scheduler
+    if not scheduler.start():
+        logger.error("Failed to start scheduler")
+        return False
+    
+    # Schedule regular transcript captures
+    if not scheduler.schedule_transcript_capture(partial(capture_transcript_task, state), transcript_interval):
+        logger.error("Failed to schedule transcript captures")
         return False
+    
+    # Schedule regular poll postings
+    if not scheduler.schedule_poll_posting(partial(post_poll_task, state), poll_interval):
+        logger.error("Failed to schedule poll postings")
+        return False
+    
+    state.active = True
+    logger.info("Session started successfully - capturing transcripts every %s minutes and posting polls every %s minutes", transcript_interval, poll_interval)
+    return True
 
-def end_session() -> bool:
+@_task("session end", False)
+def end_session(state: SessionState) -> bool:
     """
     End the current poll generation session.
     
+    Args:
+        state: Current session state
+        
     Returns:
         Boolean indicating whether session end was successful
     """
-    global session_active, recent_transcript, current_poll
-    
-    if not session_active:
+    if not state.active:
         logger.warning("No active session to end")
         return True
     
     logger.info("Ending session")
     
-    try:
-        # Stop the scheduler
-        scheduler.stop()
-        
-        # Leave Zoom meeting
-        if zoom_automation:
-            zoom_automation.leave_meeting()
-        
-        # Close browser
-        if chatgpt_integration:
-            chatgpt_integration.close_browser()
-        
-        # Reset session variables
-        session_active = False
-        recent_transcript = None
-        current_poll = None
-        
-        logger.info("Session ended successfully")
-        return True
-        
-    except Exception as e:
-        logger.error(f"Error ending session: {str(e)}")
-        return False
+    # Stop the scheduler
+    state.scheduler.stop()
+    
+    # Leave Zoom meeting
+    if state.zoom_automation:
+        state.zoom_automation.leave_meeting()
+    
+    # Close browser
+    if state.chatgpt_integration:
+        state.chatgpt_integration.close_browser()
+    
+    # Reset session variables
+    with state.lock:
+        state.active = False
+        state.meeting_id = None
+        state.recent_transcript = None
+        state.current_poll = None
+        state.last_transcript_hash = None
+        state.transcript_offset = 0
+    
+    logger.info("Session ended successfully")
+    return True
 
-def signal_handler(sig, frame):
+def signal_handler(state: SessionState, sig, frame):
     """
     Handle termination signals.
     """
-    logger.info(f"Received signal {sig}, shutting down...")
-    end_session()
-    sys.exit(0)
+    logger.info("Received signal %s, shutting down...", sig)
+    # Release the main loop first so shutdown proceeds even if ending
+    # the session fails or takes a while
+    _shutdown.set()
+    end_session(state)
 
 def parse_arguments():
     """
@@ -397,7 +598,9 @@ def parse_arguments():
 
 def main():
     """Main entry point."""
-    if not initialize():
+    from tkinter import messagebox
+    
+    if not initialize(state):
         logger.error("Failed to initialize application")
         sys.exit(1)
     
@@ -411,66 +614,66 @@ def main():
         # Clean up existing Zoom processes
         try:
             import psutil
+            killed = []
             for proc in psutil.process_iter(['name']):
-                if 'zoom' in proc.info['name'].lower():
-                    logger.info(f"Terminating existing Zoom process: {proc.info['name']}")
-                    proc.kill()
-                    time.sleep(2)
+                if (proc.info['name'] or '').lower() in ZOOM_PROCESS_NAMES:
+                    logger.info("Terminating existing Zoom process: %s", proc.info['name'])
+                    try:
+                        proc.kill()
+                        killed.append(proc)
+                    except psutil.Error as e:
+                        logger.warning("Could not terminate %s: %s", proc.info['name'], e)
+            
+            # Wait once for all of them to exit instead of sleeping per process
+            if killed:
+                psutil.wait_procs(killed, timeout=3)
         except Exception as e:
-            logger.warning(f"Could not check for existing Zoom process: {str(e)}")
+            logger.warning("Could not check for existing Zoom process: %s", e)
         
-        # Start session
-        if not start_session():
+        # Start session, joining the meeting with the credentials entered above
+        if not start_session(state, credentials):
             logger.error("Failed to start session")
             messagebox.showerror("Error", "Failed to start session. Please check logs for details.")
             sys.exit(1)
         
-        # Join the meeting
-        if not zoom_automation.join_meeting(
-            credentials["meeting_id"],
-            credentials["passcode"],
-            credentials["display_name"]
-        ):
-            logger.error("Failed to join meeting")
-            messagebox.showerror("Error", "Failed to join meeting. Please check your credentials and try again.")
-            sys.exit(1)
-        
         # Main application loop
         try:
             logger.info("Application is running. Press Ctrl+C to exit.")
-            while True:
+            
+            # Everything the loop needs is invariant, so look it up once
+            zoom_automation = state.zoom_automation
+            meeting_args = (
+                credentials["meeting_id"],
+                credentials["passcode"],
+                credentials["display_name"]
+            )
+            
+            while not _shutdown.is_set():
                 # Check meeting status every 5 seconds
                 if not zoom_automation.check_meeting_status():
                     logger.warning("Meeting status check failed, attempting to rejoin...")
-                    zoom_automation.join_meeting(
-                        credentials["meeting_id"],
-                        credentials["passcode"],
-                        credentials["display_name"]
-                    )
-                    
-                # If transcripts are enabled, check and create directory
-                if config["save_transcripts"]:
-                    os.makedirs(config["transcripts_folder"], exist_ok=True)
+                    zoom_automation.join_meeting(*meeting_args)
                 
-                time.sleep(5)
+                # Sleep until the next check, waking immediately on shutdown
+                _shutdown.wait(5)
                 
         except KeyboardInterrupt:
             logger.info("Interrupted by user")
         
     except Exception as e:
-        logger.error(f"Fatal error: {str(e)}")
+        logger.error("Fatal error: %s", e)
         messagebox.showerror("Error", f"A fatal error occurred: {str(e)}")
         sys.exit(1)
         
     finally:
         # Clean up
         try:
-            if zoom_automation:
-                zoom_automation.leave_meeting()
-            end_session()
+            if state.zoom_automation:
+                state.zoom_automation.leave_meeting()
+            end_session(state)
             logger.info("Application shutdown complete")
         except Exception as e:
-            logger.error(f"Error during cleanup: {str(e)}")
+            logger.error("Error during cleanup: %s", e)
         sys.exit(0)
 
 if __name__ == "__main__":
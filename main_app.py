@@ -11,11 +11,16 @@ import platform
 import argparse
 import json
 import re
+import queue
+import itertools
 from typing import Dict, List, Optional, Any
+from dataclasses import dataclass, field, fields
+from functools import cached_property, lru_cache
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
 import threading
-import PySimpleGUI as sg
+from concurrent.futures import ThreadPoolExecutor
 from rich.console import Console
 from rich.theme import Theme
 from rich.panel import Panel
@@ -24,18 +29,30 @@ from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeEl
 from rich.table import Table
 from rich.prompt import Prompt, Confirm
 from rich import print as rprint
-from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+# orjson is much faster at parsing JSON; fall back to the standard library
+try:
+    import orjson
+    
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+def _json_dumps(obj: Any) -> bytes:
+    # orjson can only indent by 2, so write with the standard library to keep
+    # config.json in its usual 4-space format whether or not orjson is installed
+    return json.dumps(obj, indent=4).encode("utf-8")
+
+# Load environment variables from the .env file next to this script, if there is one
+_ENV_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".env")
+if os.path.exists(_ENV_FILE):
+    from dotenv import load_dotenv
+    load_dotenv(_ENV_FILE)
 
 # Import custom modules
 from logger import get_logger, export_log_file
-from transcript_capture import TranscriptCapture
-from chatgpt_integration import ChatGPTIntegration
-from poll_posting import PollPosting
-from scheduler import TaskScheduler
-from zoom_automation import ZoomAutomation
+from scheduler import WorkflowScheduler
 
 # Initialize logger
 logger = get_logger()
@@ -62,46 +79,173 @@ DEFAULT_CONFIG = {
     "transcripts_folder": "./transcripts"
 }
 
+@dataclass(slots=True, frozen=True)
+class AppConfig:
+    """
+    Read-only snapshot of the configuration, rebuilt whenever it changes.
+    app_state.config stays the editable dict that is saved to disk.
+    """
+    zoom_client_type: str
+    transcript_interval: int
+    poll_interval: int
+    display_name: str
+    auto_enable_captions: bool
+    auto_start: bool
+    chatgpt_integration_method: str
+    check_interval: int
+    save_transcripts: bool
+    transcripts_folder: str
+    
+    @classmethod
+    def from_dict(cls, config: Dict[str, Any]) -> "AppConfig":
+        """Build a snapshot from a configuration dict, ignoring unknown keys."""
+        return cls(**{f.name: config[f.name] for f in fields(cls)})
+
+@dataclass(slots=True)
+class AppState:
+    """
+    Runtime state shared by the UI, button handler threads and the workflow thread.
+    Hold the lock when reading and updating several fields together.
+    Every field assignment moves version on, so the GUI can tell when to redraw.
+    """
+    version: int = field(default=0, repr=False)
+    is_running: bool = False
+    meeting_active: bool = False
+    meeting_id: str = ""
+    passcode: str = ""
+    recent_transcript: str = ""
+    current_poll: Optional[Dict[str, Any]] = None
+    next_transcript_time: Optional[datetime] = None
+    next_poll_time: Optional[datetime] = None
+    next_transcript_mono: Optional[float] = None
+    next_poll_mono: Optional[float] = None
+    next_transcript_str: str = ""
+    next_poll_str: str = ""
+    config: Dict[str, Any] = field(default_factory=lambda: DEFAULT_CONFIG.copy())
+    cfg: AppConfig = field(default_factory=lambda: AppConfig.from_dict(DEFAULT_CONFIG))
+    transcript_prefix: str = os.path.join(DEFAULT_CONFIG["transcripts_folder"], "")
+    lock: threading.RLock = field(default_factory=threading.RLock, repr=False)
+    
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name != "version":
+            # next() on a shared counter is atomic, so concurrent writers never reuse a version
+            object.__setattr__(self, "version", next(_state_versions))
+            if _state_listener is not None:
+                _state_listener()
+
+# Source of AppState.version values
+_state_versions = itertools.count(1)
+
+# Called after every AppState change; run_gui() sets it to wake the GUI loop
+_state_listener = None
+
 # Runtime state
-app_state = {
-    "is_running": False,
-    "meeting_active": False,
-    "meeting_id": "",
-    "passcode": "",
-    "recent_transcript": "",
-    "current_poll": None,
-    "next_transcript_time": None,
-    "next_poll_time": None,
-    "config": DEFAULT_CONFIG.copy()
-}
+app_state = AppState()
+
+class AppModules:
+    """
+    Application modules, each imported and constructed on first use so
+    Selenium and the ChatGPT client are not loaded before they are needed.
+    """
+    
+    # Modules that depend on the Zoom client type
+    CLIENT_MODULES = ("transcript_capture", "poll_posting", "zoom_automation")
+    
+    @cached_property
+    def transcript_capture(self):
+        from transcript_capture import TranscriptCapture
+        return TranscriptCapture(app_state.cfg.zoom_client_type)
+    
+    @cached_property
+    def poll_posting(self):
+        from poll_posting import create_poll_posting
+        return create_poll_posting(app_state.cfg.zoom_client_type)
+    
+    @cached_property
+    def zoom_automation(self):
+        from zoom_automation import ZoomAutomation
+        return ZoomAutomation(app_state.cfg.zoom_client_type)
+    
+    @cached_property
+    def chatgpt_integration(self):
+        from chatgpt_integration import ChatGPTIntegration
+        return ChatGPTIntegration()
+    
+    @cached_property
+    def scheduler(self):
+        from scheduler import TaskScheduler
+        return TaskScheduler()
+    
+    def loaded(self, name):
+        """Check whether a module has been constructed yet."""
+        return name in self.__dict__
+    
+    def reset(self, names):
+        """Drop constructed modules so they are rebuilt on next use."""
+        for name in names:
+            self.__dict__.pop(name, None)
 
 # Module instances
-transcript_capture = None
-chatgpt_integration = None
-poll_posting = None
-scheduler = None
-zoom_automation = None
+modules = AppModules()
+
+# Runs the automation workflow on a single background thread
+workflow = WorkflowScheduler()
 
+# Runs GUI button actions off the event loop; two workers keep browser operations from piling up
+gui_actions = ThreadPoolExecutor(max_workers=2, thread_name_prefix="gui-action")
 
-def initialize_modules():
-    """Initialize all application modules based on configuration."""
-    global transcript_capture, chatgpt_integration, poll_posting, scheduler, zoom_automation
+# Runs ChatGPT poll generation so the workflow thread stays free for Zoom UI work
+poll_generation = ThreadPoolExecutor(max_workers=1, thread_name_prefix="poll-generation")
+
+# Future of the poll generation last submitted by generate_poll_async()
+_pending_generation = None
+
+# ((st_mtime_ns, st_size), contents) of the config file as last read or written
+_config_file_cache = None
+
+# Pending deferred save_config() started by schedule_config_save()
+_config_save_timer = None
+
+# Seconds a meeting status check is reused before asking Zoom again
+MEETING_STATUS_TTL = 10
+
+# (time.monotonic() of the last check, result) for meeting_alive()
+_meeting_status = (float("-inf"), True)
+
+# Append-only file descriptor for the running automation session's transcripts
+_transcript_fd = None
+# Guards _transcript_fd so a capture can't write to it while another thread closes it
+_transcript_lock = threading.Lock()
+
+# Guards starting and stopping the shared progress display as steps on different threads come and go
+_progress_lock = threading.Lock()
+
+
+def initialize_modules(client_modules_only=False):
+    """
+    Initialize application modules based on configuration.
     
+    The modules themselves are constructed on first use; this only drops
+    any existing instances so they are rebuilt with the current settings.
+    
+    Args:
+        client_modules_only: Only recreate the modules that depend on the
+            Zoom client type, keeping ChatGPT and the scheduler as they are
+    """
     try:
         # Get client type from config
-        client_type = app_state["config"]["zoom_client_type"]
+        client_type = app_state.cfg.zoom_client_type
         logger.info(f"Initializing modules with client type: {client_type}")
         
-        # Initialize modules
-        transcript_capture = TranscriptCapture(client_type)
-        chatgpt_integration = ChatGPTIntegration()
-        poll_posting = PollPosting(client_type)
-        scheduler = TaskScheduler()
-        zoom_automation = ZoomAutomation(client_type)
+        if client_modules_only:
+            modules.reset(AppModules.CLIENT_MODULES)
+        else:
+            modules.reset(list(modules.__dict__))
         
         # Create transcripts directory if it doesn't exist
-        if app_state["config"]["save_transcripts"]:
-            os.makedirs(app_state["config"]["transcripts_folder"], exist_ok=True)
+        if app_state.cfg.save_transcripts:
+            os.makedirs(app_state.cfg.transcripts_folder, exist_ok=True)
         
         logger.info("All modules initialized successfully")
         return True
@@ -111,17 +255,33 @@ def initialize_modules():
         return False
 
 
+def refresh_config():
+    """Rebuild the configuration snapshot after app_state.config changes."""
+    app_state.cfg = AppConfig.from_dict(app_state.config)
+    # Transcript folder with a trailing separator, so file paths are a plain concatenation
+    app_state.transcript_prefix = os.path.join(app_state.cfg.transcripts_folder, "")
+
+
 def load_config():
     """Load configuration from config file."""
+    global _config_file_cache
+    
     config_path = Path("./config.json")
     
     if config_path.exists():
         try:
-            with open(config_path, 'r') as f:
-                config = json.load(f)
-                
+            # Only parse the file again if it changed since it was last read or written
+            stat = config_path.stat()
+            file_key = (stat.st_mtime_ns, stat.st_size)
+            if _config_file_cache and _config_file_cache[0] == file_key:
+                config = _config_file_cache[1]
+            else:
+                config = _json_loads(config_path.read_bytes())
+                _config_file_cache = (file_key, config)
+            
             # Update default config with loaded values
-            app_state["config"].update(config)
+            app_state.config.update(config)
+            refresh_config()
             logger.info("Configuration loaded successfully")
         except Exception as e:
             logger.error(f"Error loading configuration: {str(e)}")
@@ -133,52 +293,101 @@ def load_config():
 
 def save_config():
     """Save current configuration to config file."""
+    global _config_file_cache
+    
     config_path = Path("./config.json")
     
     try:
-        with open(config_path, 'w') as f:
-            json.dump(app_state["config"], f, indent=4)
+        config_path.write_bytes(_json_dumps(app_state.config))
+        stat = config_path.stat()
+        _config_file_cache = ((stat.st_mtime_ns, stat.st_size), dict(app_state.config))
         logger.info("Configuration saved successfully")
     except Exception as e:
         logger.error(f"Error saving configuration: {str(e)}")
         console.print(f"[warning]Warning: Could not save configuration: {str(e)}")
 
 
+@lru_cache(maxsize=1)
+def _progress():
+    """Get the shared progress display, creating it on first use."""
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TimeElapsedColumn(),
+        console=console,
+        transient=True
+    )
+
+
+@contextmanager
+def progress_task(description):
+    """
+    Show a spinner on the shared progress display while a step runs.
+    
+    Args:
+        description: Text shown next to the spinner
+    """
+    progress = _progress()
+    with _progress_lock:
+        if not progress.tasks:
+            progress.start()
+        task = progress.add_task(description, total=None)
+    try:
+        yield
+    finally:
+        with _progress_lock:
+            progress.remove_task(task)
+            if not progress.tasks:
+                progress.stop()
+
+
+def schedule_config_save(delay=0.5):
+    """
+    Save the configuration shortly, off the calling thread.
+    
+    Saves requested again before the delay runs out are coalesced into one write.
+    
+    Args:
+        delay: Seconds to wait before writing the file
+    """
+    global _config_save_timer
+    
+    if _config_save_timer:
+        _config_save_timer.cancel()
+    _config_save_timer = threading.Timer(delay, save_config)
+    _config_save_timer.daemon = True
+    _config_save_timer.start()
+
+
 def join_meeting(meeting_id, passcode):
     """Join a Zoom meeting."""
-    global zoom_automation
+    global _meeting_status
     
     # Store meeting details
-    app_state["meeting_id"] = meeting_id
-    app_state["passcode"] = passcode
+    app_state.meeting_id = meeting_id
+    app_state.passcode = passcode
     
     # Join meeting
-    display_name = app_state["config"]["display_name"]
-    client_type = app_state["config"]["zoom_client_type"]
+    display_name = app_state.cfg.display_name
+    client_type = app_state.cfg.zoom_client_type
     
     console.print(f"[info]Joining Zoom meeting with ID {meeting_id}...")
     
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TimeElapsedColumn(),
-        console=console
-    ) as progress:
-        task = progress.add_task("[blue]Joining meeting...", total=None)
-        
-        result = zoom_automation.join_meeting(meeting_id, passcode, display_name)
-        progress.update(task, completed=1)
+    with progress_task("[blue]Joining meeting..."):
+        result = modules.zoom_automation.join_meeting(meeting_id, passcode, display_name)
     
     if result:
-        app_state["meeting_active"] = True
+        # Don't reuse a status from a previous meeting
+        _meeting_status = (float("-inf"), True)
+        app_state.meeting_active = True
         logger.info(f"Successfully joined meeting {meeting_id}")
         console.print(f"[success]Successfully joined meeting!")
         
         # Enable captions if configured
-        if app_state["config"]["auto_enable_captions"]:
+        if app_state.cfg.auto_enable_captions:
             console.print("[info]Enabling closed captions...")
-            if zoom_automation.enable_closed_captioning():
+            if modules.zoom_automation.enable_closed_captioning():
                 console.print("[success]Closed captions enabled")
             else:
                 console.print("[warning]Could not enable closed captions - may not be available")
@@ -192,19 +401,18 @@ def join_meeting(meeting_id, passcode):
 
 def leave_meeting():
     """Leave the current Zoom meeting."""
-    global zoom_automation
-    
-    if not app_state["meeting_active"]:
+    if not app_state.meeting_active:
         console.print("[warning]No active meeting to leave")
         return True
     
     console.print("[info]Leaving Zoom meeting...")
-    result = zoom_automation.leave_meeting()
+    result = modules.zoom_automation.leave_meeting()
     
     if result:
-        app_state["meeting_active"] = False
-        app_state["meeting_id"] = ""
-        app_state["passcode"] = ""
+        with app_state.lock:
+            app_state.meeting_active = False
+            app_state.meeting_id = ""
+            app_state.passcode = ""
         logger.info("Left meeting successfully")
         console.print("[success]Left meeting successfully")
         return True
@@ -216,25 +424,23 @@ def leave_meeting():
 
 def capture_transcript():
     """Capture a transcript from the current meeting."""
-    global transcript_capture
-    
-    if not app_state["meeting_active"]:
+    if not app_state.meeting_active:
         logger.warning("Cannot capture transcript - no active meeting")
         console.print("[warning]Cannot capture transcript - not in a meeting")
         return False
     
     console.print("[info]Capturing transcript from meeting...")
     
-    transcript = transcript_capture.capture_transcript()
+    transcript = modules.transcript_capture.capture_transcript()
     
     if transcript:
-        app_state["recent_transcript"] = transcript
+        app_state.recent_transcript = transcript
         # Save transcript if configured
-        if app_state["config"]["save_transcripts"]:
+        if app_state.cfg.save_transcripts:
             save_transcript(transcript)
             
         # Update next transcript capture time
-        app_state["next_transcript_time"] = datetime.now() + timedelta(minutes=app_state["config"]["transcript_interval"])
+        schedule_next("transcript", app_state.cfg.transcript_interval)
         
         logger.info(f"Transcript captured: {len(transcript)} characters")
         console.print(f"[success]Transcript captured successfully ({len(transcript)} characters)")
@@ -249,8 +455,14 @@ def save_transcript(transcript):
     """Save the transcript to a file."""
     try:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"transcript_{timestamp}.txt"
-        filepath = os.path.join(app_state["config"]["transcripts_folder"], filename)
+        
+        # While automation runs, captures go to the session file opened by start_automation
+        with _transcript_lock:
+            if _transcript_fd is not None:
+                os.write(_transcript_fd, f"\n==== {timestamp} ====\n{transcript}\n".encode("utf-8"))
+                return True
+        
+        filepath = f"{app_state.transcript_prefix}transcript_{timestamp}.txt"
         
         with open(filepath, 'w', encoding='utf-8') as f:
             f.write(transcript)
@@ -264,31 +476,22 @@ def save_transcript(transcript):
 
 def generate_poll():
     """Generate a poll from the recent transcript."""
-    global chatgpt_integration
-    
-    if not app_state["recent_transcript"]:
+    if not app_state.recent_transcript:
         logger.warning("Cannot generate poll - no transcript available")
         console.print("[warning]Cannot generate poll - no transcript available")
         return False
     
     console.print("[info]Generating poll from transcript...")
     
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console
-    ) as progress:
-        task = progress.add_task("[blue]Processing with ChatGPT...", total=None)
-        
-        poll_data = chatgpt_integration.generate_poll_with_chatgpt(app_state["recent_transcript"])
-        progress.update(task, completed=1)
+    with progress_task("[blue]Processing with ChatGPT..."):
+        poll_data = modules.chatgpt_integration.generate_poll_with_chatgpt(app_state.recent_transcript)
     
     if poll_data:
-        app_state["current_poll"] = poll_data
+        app_state.current_poll = poll_data
         logger.info(f"Poll generated: {poll_data['question']}")
         console.print(f"[success]Poll generated successfully:")
-        console.print(Panel(f"{poll_data['question']}\n\n" + "\n".join([f"{i+1}. {opt}" for i, opt in enumerate(poll_data['options'])]), 
-                           title="Generated Poll", border_style="green"))
+        options = "\n".join(f"{i}. {opt}" for i, opt in enumerate(poll_data['options'], 1))
+        console.print(Panel(f"{poll_data['question']}\n\n{options}", title="Generated Poll", border_style="green"))
         return True
     else:
         logger.error("Failed to generate poll")
@@ -296,31 +499,68 @@ def generate_poll():
         return False
 
 
+def generate_poll_async(post_delay=None):
+    """
+    Generate a poll on the poll generation thread.
+    
+    The ChatGPT request takes seconds; running it here lets the workflow
+    thread capture transcripts and post polls in the meantime. A call made
+    while a generation is still running shares it instead of queueing another.
+    
+    Args:
+        post_delay: If given, post the poll this many seconds after it is generated
+        
+    Returns:
+        Future resolving to the result of generate_poll()
+    """
+    global _pending_generation
+    
+    with app_state.lock:
+        if _pending_generation is None or _pending_generation.done():
+            _pending_generation = poll_generation.submit(generate_poll)
+        future = _pending_generation
+    
+    if post_delay is not None:
+        # The callback runs on the generation thread, so tie it to the run that asked for it
+        generation = workflow.generation
+        
+        def post_when_generated(done):
+            if app_state.is_running and not done.cancelled() and not done.exception() and done.result():
+                workflow.call_later(post_delay, post_poll, generation)
+        future.add_done_callback(post_when_generated)
+    
+    return future
+
+
 def post_poll():
     """Post the current poll to the Zoom meeting."""
-    global poll_posting
-    
-    if not app_state["meeting_active"]:
+    if not app_state.meeting_active:
         logger.warning("Cannot post poll - no active meeting")
         console.print("[warning]Cannot post poll - not in a meeting")
         return False
     
-    if not app_state["current_poll"]:
+    if not app_state.current_poll:
         logger.warning("Cannot post poll - no poll generated")
         console.print("[warning]Cannot post poll - no poll has been generated")
         return False
     
     console.print("[info]Posting poll to meeting...")
     
-    result = poll_posting.post_poll_to_zoom(app_state["current_poll"])
+    # The web client is driven through the browser session that joined the meeting
+    if modules.loaded("zoom_automation"):
+        modules.poll_posting.driver = modules.zoom_automation.driver
+    
+    poll_data = app_state.current_poll
+    result = modules.poll_posting.post_poll_to_zoom(poll_data, app_state.meeting_id)
     
     if result:
-        # Clear current poll after posting
-        poll_data = app_state["current_poll"]
-        app_state["current_poll"] = None
+        # Clear current poll after posting, unless a newer one was generated meanwhile
+        with app_state.lock:
+            if app_state.current_poll is poll_data:
+                app_state.current_poll = None
         
         # Update next poll time
-        app_state["next_poll_time"] = datetime.now() + timedelta(minutes=app_state["config"]["poll_interval"])
+        schedule_next("poll", app_state.cfg.poll_interval)
         
         logger.info(f"Poll posted successfully: {poll_data['question']}")
         console.print("[success]Poll posted successfully")
@@ -331,87 +571,186 @@ def post_poll():
         return False
 
 
+def meeting_alive():
+    """
+    Check whether the current meeting is still active.
+    
+    The Zoom status check is slow, so a result is reused for
+    MEETING_STATUS_TTL seconds.
+    
+    Returns:
+        Boolean indicating whether the meeting is active
+    """
+    global _meeting_status
+    
+    if not app_state.meeting_active:
+        return False
+    
+    now = time.monotonic()
+    checked_at, alive = _meeting_status
+    if now - checked_at < MEETING_STATUS_TTL:
+        return alive
+    
+    alive = modules.zoom_automation.check_meeting_status()
+    _meeting_status = (now, alive)
+    return alive
+
+
 def run_scheduled_workflow():
     """Run the main workflow on a schedule."""
-    if not app_state["is_running"]:
+    if not app_state.is_running:
         return
     
     try:
         # Check if meeting is still active
-        if app_state["meeting_active"] and not zoom_automation.check_meeting_status():
+        if app_state.meeting_active and not meeting_alive():
             logger.warning("Meeting appears to have ended")
             console.print("[warning]Meeting appears to have ended")
-            app_state["meeting_active"] = False
+            app_state.meeting_active = False
             stop_automation()
             return
         
-        now = datetime.now()
+        now = time.monotonic()
         
         # Check if it's time to capture transcript
-        if app_state["next_transcript_time"] and now >= app_state["next_transcript_time"]:
+        if app_state.next_transcript_mono and now >= app_state.next_transcript_mono:
             logger.info("Scheduled transcript capture triggered")
             capture_transcript()
             
             # Schedule poll generation after transcript capture
-            threading.Timer(10, generate_poll).start()
+            workflow.call_later(10, generate_poll_async)
         
         # Check if it's time to post poll
-        if app_state["next_poll_time"] and now >= app_state["next_poll_time"]:
+        if app_state.next_poll_mono and now >= app_state.next_poll_mono:
             logger.info("Scheduled poll posting triggered")
             
             # If we have a current poll, post it
-            if app_state["current_poll"]:
+            if app_state.current_poll:
                 post_poll()
             # Otherwise try to generate and post a new one
-            elif app_state["recent_transcript"]:
-                if generate_poll():
-                    threading.Timer(5, post_poll).start()
+            elif app_state.recent_transcript:
+                generate_poll_async(post_delay=5)
         
         # Schedule next check
-        if app_state["is_running"]:
-            threading.Timer(app_state["config"]["check_interval"], run_scheduled_workflow).start()
+        if app_state.is_running:
+            workflow.call_later(next_check_delay(), run_scheduled_workflow)
             
     except Exception as e:
         logger.error(f"Error in scheduled workflow: {str(e)}")
         console.print(f"[error]Error in automation workflow: {str(e)}")
 
 
-def start_automation():
-    """Start the automated workflow."""
-    if app_state["is_running"]:
-        console.print("[warning]Automation is already running")
-        return
-    
-    if not app_state["meeting_active"]:
-        console.print("[warning]Cannot start automation - not in a meeting")
-        return
+def next_check_delay():
+    """
+    Get the delay until the next workflow check.
+    
+    Returns:
+        Seconds until the next check: the check interval, or less if a
+        transcript capture or poll posting falls due before then
+    """
+    delay = app_state.cfg.check_interval
+    now = time.monotonic()
+    
+    for due in (app_state.next_transcript_mono, app_state.next_poll_mono):
+        # Overdue tasks are retried on the regular interval
+        if due and due > now:
+            delay = min(delay, due - now)
+    
+    return delay
+
+
+def schedule_next(task, minutes):
+    """
+    Set when a scheduled task is next due.
+    
+    Args:
+        task: "transcript" or "poll"
+        minutes: Minutes from now until the task is due
+    """
+    # The monotonic deadline drives the scheduler; the datetime is only for display
+    due = datetime.now() + timedelta(minutes=minutes)
+    with app_state.lock:
+        setattr(app_state, f"next_{task}_mono", time.monotonic() + minutes * 60)
+        setattr(app_state, f"next_{task}_time", due)
+        setattr(app_state, f"next_{task}_str", due.strftime("%H:%M:%S"))
+
+
+def open_transcript_session():
+    """Open the append-only transcript file for a new automation session."""
+    global _transcript_fd
     
-    app_state["is_running"] = True
+    with _transcript_lock:
+        if not app_state.cfg.save_transcripts or _transcript_fd is not None:
+            return
+        
+        try:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filepath = f"{app_state.transcript_prefix}transcript_session_{timestamp}.txt"
+            _transcript_fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            logger.info(f"Saving session transcripts to {filepath}")
+        except Exception as e:
+            logger.error(f"Error opening transcript file: {str(e)}")
+
+
+def close_transcript_session():
+    """Flush and close the automation session's transcript file."""
+    global _transcript_fd
     
-    # Set initial scheduled times
-    app_state["next_transcript_time"] = datetime.now() + timedelta(minutes=app_state["config"]["transcript_interval"])
-    app_state["next_poll_time"] = datetime.now() + timedelta(minutes=app_state["config"]["poll_interval"])
+    with _transcript_lock:
+        if _transcript_fd is None:
+            return
+        
+        fd, _transcript_fd = _transcript_fd, None
+        try:
+            os.fsync(fd)
+        except Exception as e:
+            logger.error(f"Error flushing transcript file: {str(e)}")
+        finally:
+            os.close(fd)
+
+
+def start_automation():
+    """Start the automated workflow."""
+    with app_state.lock:
+        if app_state.is_running:
+            console.print("[warning]Automation is already running")
+            return
+        
+        if not app_state.meeting_active:
+            console.print("[warning]Cannot start automation - not in a meeting")
+            return
+        
+        app_state.is_running = True
+        
+        # Set initial scheduled times
+        schedule_next("transcript", app_state.cfg.transcript_interval)
+        schedule_next("poll", app_state.cfg.poll_interval)
     
     # Perform initial capture and poll
+    open_transcript_session()
+    workflow.start()
     capture_transcript()
-    threading.Timer(5, generate_poll).start()
+    workflow.call_later(5, generate_poll_async)
     
     # Start the scheduled workflow
-    threading.Timer(app_state["config"]["check_interval"], run_scheduled_workflow).start()
+    workflow.call_later(next_check_delay(), run_scheduled_workflow)
     
     logger.info("Automation started")
     console.print("[success]Automation started successfully")
-    console.print(f"[info]Next transcript capture: {app_state['next_transcript_time'].strftime('%H:%M:%S')}")
-    console.print(f"[info]Next poll posting: {app_state['next_poll_time'].strftime('%H:%M:%S')}")
+    console.print(f"[info]Next transcript capture: {app_state.next_transcript_str}")
+    console.print(f"[info]Next poll posting: {app_state.next_poll_str}")
 
 
 def stop_automation():
     """Stop the automated workflow."""
-    if not app_state["is_running"]:
-        console.print("[warning]Automation is not running")
-        return
-    
-    app_state["is_running"] = False
+    with app_state.lock:
+        if not app_state.is_running:
+            console.print("[warning]Automation is not running")
+            return
+        
+        app_state.is_running = False
+    workflow.stop()
+    close_transcript_session()
     logger.info("Automation stopped")
     console.print("[info]Automation stopped")
 
@@ -421,56 +760,78 @@ def cleanup():
     logger.info("Cleaning up resources")
     
     # Stop automation if running
-    if app_state["is_running"]:
+    if app_state.is_running:
         stop_automation()
     
     # Leave meeting if active
-    if app_state["meeting_active"]:
+    if app_state.meeting_active:
         leave_meeting()
     
     # Close browser if open
-    if chatgpt_integration:
-        chatgpt_integration.close_browser()
-    if zoom_automation and zoom_automation.driver:
-        zoom_automation.close_browser()
+    if modules.loaded("chatgpt_integration"):
+        modules.chatgpt_integration.close_browser()
+    if modules.loaded("zoom_automation") and modules.zoom_automation.driver:
+        modules.zoom_automation.close_browser()
     
-    # Save configuration
+    # Close the Zoom API connection if one was opened
+    if modules.loaded("poll_posting") and modules.poll_posting.api:
+        modules.poll_posting.api.close()
+    
+    # Drop GUI actions that have not started yet
+    gui_actions.shutdown(wait=False, cancel_futures=True)
+    poll_generation.shutdown(wait=False, cancel_futures=True)
+    
+    # Make sure the session transcript is on disk
+    close_transcript_session()
+    
+    # Save configuration, replacing any deferred save still waiting
+    if _config_save_timer:
+        _config_save_timer.cancel()
     save_config()
     
     logger.info("Cleanup complete")
 
 
+# Columns shared by the status and configuration tables
+TABLE_COLUMNS = (("Setting", "cyan"), ("Value", "green"))
+
+# Yes/no cells for the status table
+YES_NO = ("✗ No", "✓ Yes")
+
+
+def _new_table(title):
+    """Create a two-column setting/value table."""
+    table = Table(title=title)
+    for name, style in TABLE_COLUMNS:
+        table.add_column(name, style=style)
+    return table
+
+
 def show_status():
     """Display the current application status."""
-    table = Table(title="Application Status")
+    table = _new_table("Application Status")
     
-    table.add_column("Setting", style="cyan")
-    table.add_column("Value", style="green")
+    table.add_row("Running", YES_NO[bool(app_state.is_running)])
+    table.add_row("Meeting Active", YES_NO[bool(app_state.meeting_active)])
+    if app_state.meeting_active:
+        table.add_row("Meeting ID", app_state.meeting_id)
+    table.add_row("Zoom Client", app_state.cfg.zoom_client_type.capitalize())
+    table.add_row("Transcript Available", YES_NO[bool(app_state.recent_transcript)])
+    table.add_row("Poll Ready", YES_NO[bool(app_state.current_poll)])
     
-    table.add_row("Running", "✓ Yes" if app_state["is_running"] else "✗ No")
-    table.add_row("Meeting Active", "✓ Yes" if app_state["meeting_active"] else "✗ No")
-    if app_state["meeting_active"]:
-        table.add_row("Meeting ID", app_state["meeting_id"])
-    table.add_row("Zoom Client", app_state["config"]["zoom_client_type"].capitalize())
-    table.add_row("Transcript Available", "✓ Yes" if app_state["recent_transcript"] else "✗ No")
-    table.add_row("Poll Ready", "✓ Yes" if app_state["current_poll"] else "✗ No")
-    
-    if app_state["next_transcript_time"]:
-        table.add_row("Next Transcript", app_state["next_transcript_time"].strftime("%H:%M:%S"))
-    if app_state["next_poll_time"]:
-        table.add_row("Next Poll", app_state["next_poll_time"].strftime("%H:%M:%S"))
+    if app_state.next_transcript_str:
+        table.add_row("Next Transcript", app_state.next_transcript_str)
+    if app_state.next_poll_str:
+        table.add_row("Next Poll", app_state.next_poll_str)
     
     console.print(table)
 
 
 def show_config():
     """Display the current configuration."""
-    table = Table(title="Application Configuration")
-    
-    table.add_column("Setting", style="cyan")
-    table.add_column("Value", style="green")
+    table = _new_table("Application Configuration")
     
-    for key, value in app_state["config"].items():
+    for key, value in app_state.config.items():
         table.add_row(key.replace("_", " ").title(), str(value))
     
     console.print(table)
@@ -482,49 +843,50 @@ def change_config():
     console.print("Current configuration:")
     show_config()
     
-    config = app_state["config"]
+    config = app_state.config
+    cfg = app_state.cfg
     
     # Client type
     client_type = Prompt.ask(
         "Zoom client type",
         choices=["web", "desktop"],
-        default=config["zoom_client_type"]
+        default=cfg.zoom_client_type
     )
     
     # Intervals
     transcript_interval = int(Prompt.ask(
         "Transcript capture interval (minutes)",
-        default=str(config["transcript_interval"])
+        default=str(cfg.transcript_interval)
     ))
     
     poll_interval = int(Prompt.ask(
         "Poll posting interval (minutes)",
-        default=str(config["poll_interval"])
+        default=str(cfg.poll_interval)
     ))
     
     # Display name
     display_name = Prompt.ask(
         "Display name in meetings",
-        default=config["display_name"]
+        default=cfg.display_name
     )
     
     # Auto-enable captions
     auto_captions = Confirm.ask(
         "Automatically enable closed captions?",
-        default=config["auto_enable_captions"]
+        default=cfg.auto_enable_captions
     )
     
     # Integration method
     integration_method = Prompt.ask(
         "ChatGPT integration method",
         choices=["browser", "api"],
-        default=config["chatgpt_integration_method"]
+        default=cfg.chatgpt_integration_method
     )
     
     # Save transcripts
     save_transcripts = Confirm.ask(
         "Save transcripts to files?",
-        default=config["save_transcripts"]
+        default=cfg.save_transcripts
     )
     
     # Update config
@@ -535,11 +897,12 @@ def change_config():
     config["auto_enable_captions"] = auto_captions
     config["chatgpt_integration_method"] = integration_method
     config["save_transcripts"] = save_transcripts
+    refresh_config()
     
     # Reinitialize modules if client type changed
-    if client_type != app_state["config"]["zoom_client_type"]:
+    if client_type != cfg.zoom_client_type:
         console.print("[info]Client type changed, reinitializing modules...")
-        initialize_modules()
+        initialize_modules(client_modules_only=True)
     
     # Save configuration
     save_config()
@@ -547,15 +910,58 @@ def change_config():
     console.print("[success]Configuration updated successfully")
 
 
+def _cli_join_meeting():
+    """Ask for meeting details and join, starting automation if configured."""
+    meeting_id = Prompt.ask("Enter meeting ID")
+    passcode = Prompt.ask("Enter meeting passcode")
+    join_meeting(meeting_id, passcode)
+    
+    if app_state.meeting_active and app_state.cfg.auto_start:
+        start_automation()
+
+
+def _cli_configuration():
+    """Show or change the configuration."""
+    subchoice = Prompt.ask(CLI_CONFIG_PROMPT, choices=CLI_CONFIG_CHOICES)
+    if subchoice == "1":
+        show_config()
+    else:
+        change_config()
+
+
+# CLI menu: choice -> (label, handler); "0" exits and is handled by run_cli
+CLI_MENU = {
+    "1": ("Join a meeting", _cli_join_meeting),
+    "2": ("Leave meeting", leave_meeting),
+    "3": ("Start automation", start_automation),
+    "4": ("Stop automation", stop_automation),
+    "5": ("Capture transcript now", capture_transcript),
+    "6": ("Generate poll now", generate_poll),
+    "7": ("Post poll now", post_poll),
+    "8": ("Show status", show_status),
+    "9": ("Show/change configuration", _cli_configuration),
+}
+CLI_EXIT_CHOICE = "0"
+CLI_MENU_CHOICES = [CLI_EXIT_CHOICE, *CLI_MENU]
+CLI_MENU_TEXT = "\n[bold cyan]Main Menu[/bold cyan]\n" + "\n".join(
+    f"{choice}. {label}" for choice, (label, _) in CLI_MENU.items()
+) + f"\n{CLI_EXIT_CHOICE}. Exit"
+CLI_MENU_PROMPT = "Select an option"
+CLI_CONFIG_PROMPT = "1. Show configuration\n2. Change configuration"
+CLI_CONFIG_CHOICES = ["1", "2"]
+
+CLI_BANNER = Panel.fit(
+    "[bold green]Automated Zoom Poll Generator[/bold green]\n"
+    "[blue]Version 1.0.0[/blue]\n\n"
+    "This application automates capturing transcripts from Zoom meetings,\n"
+    "generating polls based on the content, and posting them automatically.",
+    title="Welcome", subtitle="Production Version"
+)
+
+
 def run_cli():
     """Run the application in CLI mode."""
-    console.print(Panel.fit(
-        "[bold green]Automated Zoom Poll Generator[/bold green]\n"
-        "[blue]Version 1.0.0[/blue]\n\n"
-        "This application automates capturing transcripts from Zoom meetings,\n"
-        "generating polls based on the content, and posting them automatically.",
-        title="Welcome", subtitle="Production Version"
-    ))
+    console.print(CLI_BANNER)
     
     # Load configuration
     load_config()
@@ -567,59 +973,16 @@ def run_cli():
     
     try:
         while True:
-            console.print("\n[bold cyan]Main Menu[/bold cyan]")
-            console.print("1. Join a meeting")
-            console.print("2. Leave meeting")
-            console.print("3. Start automation")
-            console.print("4. Stop automation")
-            console.print("5. Capture transcript now")
-            console.print("6. Generate poll now")
-            console.print("7. Post poll now")
-            console.print("8. Show status")
-            console.print("9. Show/change configuration")
-            console.print("0. Exit")
+            console.print(CLI_MENU_TEXT)
             
-            choice = Prompt.ask("Select an option", choices=["0", "1", "2", "3", "4", "5", "6", "7", "8", "9"])
+            choice = Prompt.ask(CLI_MENU_PROMPT, choices=CLI_MENU_CHOICES)
             
-            if choice == "1":  # Join a meeting
-                meeting_id = Prompt.ask("Enter meeting ID")
-                passcode = Prompt.ask("Enter meeting passcode")
-                join_meeting(meeting_id, passcode)
-                
-                if app_state["meeting_active"] and app_state["config"]["auto_start"]:
-                    start_automation()
-                    
-            elif choice == "2":  # Leave meeting
-                leave_meeting()
-                
-            elif choice == "3":  # Start automation
-                start_automation()
-                
-            elif choice == "4":  # Stop automation
-                stop_automation()
-                
-            elif choice == "5":  # Capture transcript
-                capture_transcript()
-                
-            elif choice == "6":  # Generate poll
-                generate_poll()
-                
-            elif choice == "7":  # Post poll
-                post_poll()
-                
-            elif choice == "8":  # Show status
-                show_status()
-                
-            elif choice == "9":  # Show/change configuration
-                subchoice = Prompt.ask("1. Show configuration\n2. Change configuration", choices=["1", "2"])
-                if subchoice == "1":
-                    show_config()
-                else:
-                    change_config()
-                    
-            elif choice == "0":  # Exit
+            if choice == CLI_EXIT_CHOICE:
                 if Confirm.ask("Are you sure you want to exit?"):
                     break
+                continue
+            
+            CLI_MENU[choice][1]()
     
     except KeyboardInterrupt:
         console.print("\n[warning]Interrupted by user")
@@ -634,6 +997,8 @@ def run_cli():
 
 def create_gui_window():
     """Create the main GUI window."""
+    import PySimpleGUI as sg
+    
     sg.theme('DarkBlue3')  # Set the theme
     
     # Define the layout
@@ -673,70 +1038,108 @@ def create_gui_window():
     return window
 
 
+# Last value written to each GUI element property, so unchanged updates are skipped
+_gui_last = {}
+
+
+def _set_value(window, key, value):
+    """Update an element's value if it differs from the last one written."""
+    if _gui_last.get((key, "value")) != value:
+        window[key].update(value)
+        _gui_last[(key, "value")] = value
+
+
+def _set_disabled(window, key, disabled):
+    """Enable or disable an element if its state differs from the last one written."""
+    if _gui_last.get((key, "disabled")) != disabled:
+        window[key].update(disabled=disabled)
+        _gui_last[(key, "disabled")] = disabled
+
+
 def update_gui(window):
     """Update the GUI with current application state."""
-    # Update meeting status
-    if app_state["meeting_active"]:
-        window['-MEETING_STATUS-'].update('In meeting')
-        window['-JOIN-'].update(disabled=True)
-        window['-LEAVE-'].update(disabled=False)
-        window['-CAPTURE-'].update(disabled=False)
-        window['-START-'].update(disabled=False)
-    else:
-        window['-MEETING_STATUS-'].update('Not in meeting')
-        window['-JOIN-'].update(disabled=False)
-        window['-LEAVE-'].update(disabled=True)
-        window['-CAPTURE-'].update(disabled=True)
-        window['-START-'].update(disabled=True)
-        window['-GENERATE-'].update(disabled=True)
-        window['-POST-'].update(disabled=True)
-    
-    # Update automation status
-    if app_state["is_running"]:
-        window['-AUTO_STATUS-'].update('Running')
-        window['-START-'].update(disabled=True)
-        window['-STOP-'].update(disabled=False)
-    else:
-        window['-AUTO_STATUS-'].update('Not running')
-        window['-START-'].update(disabled=not app_state["meeting_active"])
-        window['-STOP-'].update(disabled=True)
-    
-    # Update transcript status
-    if app_state["recent_transcript"]:
-        window['-TRANSCRIPT_STATUS-'].update('Available')
-        window['-GENERATE-'].update(disabled=False)
-    else:
-        window['-TRANSCRIPT_STATUS-'].update('Not available')
-        window['-GENERATE-'].update(disabled=True)
-    
-    # Update poll status
-    if app_state["current_poll"]:
-        window['-POLL_STATUS-'].update('Ready to post')
-        window['-POST-'].update(disabled=not app_state["meeting_active"])
-    else:
-        window['-POLL_STATUS-'].update('Not available')
-        window['-POST-'].update(disabled=True)
+    meeting_active = app_state.meeting_active
+    is_running = app_state.is_running
+    has_transcript = bool(app_state.recent_transcript)
+    has_poll = bool(app_state.current_poll)
+    
+    # Update status labels
+    _set_value(window, '-MEETING_STATUS-', 'In meeting' if meeting_active else 'Not in meeting')
+    _set_value(window, '-AUTO_STATUS-', 'Running' if is_running else 'Not running')
+    _set_value(window, '-TRANSCRIPT_STATUS-', 'Available' if has_transcript else 'Not available')
+    _set_value(window, '-POLL_STATUS-', 'Ready to post' if has_poll else 'Not available')
+    
+    # Update button states
+    _set_disabled(window, '-JOIN-', meeting_active)
+    _set_disabled(window, '-LEAVE-', not meeting_active)
+    _set_disabled(window, '-CAPTURE-', not meeting_active)
+    _set_disabled(window, '-START-', is_running or not meeting_active)
+    _set_disabled(window, '-STOP-', not is_running)
+    _set_disabled(window, '-GENERATE-', not has_transcript)
+    _set_disabled(window, '-POST-', not (has_poll and meeting_active))
     
     # Update scheduled times
-    if app_state["next_transcript_time"]:
-        window['-NEXT_TRANSCRIPT-'].update(app_state["next_transcript_time"].strftime("%H:%M:%S"))
-    else:
-        window['-NEXT_TRANSCRIPT-'].update('Not scheduled')
-        
-    if app_state["next_poll_time"]:
-        window['-NEXT_POLL-'].update(app_state["next_poll_time"].strftime("%H:%M:%S"))
-    else:
-        window['-NEXT_POLL-'].update('Not scheduled')
+    _set_value(window, '-NEXT_TRANSCRIPT-', app_state.next_transcript_str or 'Not scheduled')
+    _set_value(window, '-NEXT_POLL-', app_state.next_poll_str or 'Not scheduled')
+
+
+# Log lines waiting for the event loop to write them to the GUI log output
+_gui_log_queue = queue.SimpleQueue()
+
+# Event posted to wake the GUI loop after the application state changes
+GUI_STATE_EVENT = '-STATE-'
+
+# Event posted to wake the GUI loop when log lines are waiting to be written
+GUI_LOG_EVENT = '-LOG_LINES-'
+
+# Choices for the interval spinners in the configuration window
+INTERVAL_MINUTES = list(range(1, 61))
+
+# Fallback refresh of the GUI when no events arrive (milliseconds)
+GUI_REFRESH_TIMEOUT = 30000
+
+# Set while a GUI_STATE_EVENT / GUI_LOG_EVENT is waiting to be handled, so wakes are coalesced
+_gui_wake_pending = threading.Event()
+_gui_log_pending = threading.Event()
+
+
+def _post_gui_event(window, event, pending):
+    """Post event to the GUI loop unless one is already waiting to be handled."""
+    if not pending.is_set():
+        pending.set()
+        window.write_event_value(event, None)
 
 
 def add_log_to_gui(window, message):
-    """Add a log message to the GUI log output."""
+    """
+    Queue a log message for the GUI log output.
+    Safe to call from any thread; flush_gui_log() writes it out.
+    """
     timestamp = datetime.now().strftime("%H:%M:%S")
-    window['-LOG-'].print(f"[{timestamp}] {message}")
+    _gui_log_queue.put_nowait(f"[{timestamp}] {message}")
+    _post_gui_event(window, GUI_LOG_EVENT, _gui_log_pending)
+
+
+def flush_gui_log(window):
+    """Write all queued log messages to the GUI log output in one update."""
+    lines = []
+    try:
+        while True:
+            lines.append(_gui_log_queue.get_nowait())
+    except queue.Empty:
+        pass
+    
+    if lines:
+        window['-LOG-'].update('\n'.join(lines) + '\n', append=True)
 
 
 def run_gui():
     """Run the application in GUI mode."""
+    global _state_listener
+    
+    # PySimpleGUI pulls in tkinter, so only load it for the GUI
+    import PySimpleGUI as sg
+    
     # Load configuration
     load_config()
     
@@ -762,12 +1165,28 @@ def run_gui():
     # Log startup
     add_log_to_gui(window, "Application started")
     
+    # Wake the loop whenever any thread changes the application state
+    _state_listener = lambda: _post_gui_event(window, GUI_STATE_EVENT, _gui_wake_pending)
+    
     # Main event loop
     try:
+        rendered_version = app_state.version
+        update_gui(window)
+        flush_gui_log(window)
+        
         while True:
-            event, values = window.read(timeout=1000)  # Update GUI every second
+            # Background work wakes the loop through GUI_STATE_EVENT and GUI_LOG_EVENT
+            event, values = window.read(timeout=GUI_REFRESH_TIMEOUT)
             
-            if event == sg.WIN_CLOSED or event == '-EXIT-':
+            if event == GUI_STATE_EVENT:
+                # Handled by the refresh below; later changes post a new event
+                _gui_wake_pending.clear()
+            
+            elif event == GUI_LOG_EVENT:
+                # Written by the flush below; later lines post a new event
+                _gui_log_pending.clear()
+            
+            elif event == sg.WIN_CLOSED or event == '-EXIT-':
                 if sg.popup_yes_no("Are you sure you want to exit?") == "Yes":
                     break
             
@@ -779,51 +1198,51 @@ def run_gui():
                     sg.popup_error("Please enter both meeting ID and passcode")
                     continue
                 
-                # Join meeting in a separate thread to keep GUI responsive
+                # Join meeting on a worker thread to keep GUI responsive
                 def join_thread():
                     result = join_meeting(meeting_id, passcode)
-                    if result and app_state["config"]["auto_start"]:
+                    if result and app_state.cfg.auto_start:
                         start_automation()
                 
-                threading.Thread(target=join_thread, daemon=True).start()
+                gui_actions.submit(join_thread)
             
             elif event == '-LEAVE-':
-                threading.Thread(target=leave_meeting, daemon=True).start()
+                gui_actions.submit(leave_meeting)
             
             elif event == '-START-':
-                threading.Thread(target=start_automation, daemon=True).start()
+                gui_actions.submit(start_automation)
             
             elif event == '-STOP-':
                 stop_automation()
             
             elif event == '-CAPTURE-':
-                threading.Thread(target=capture_transcript, daemon=True).start()
+                gui_actions.submit(capture_transcript)
             
             elif event == '-GENERATE-':
-                threading.Thread(target=generate_poll, daemon=True).start()
+                gui_actions.submit(generate_poll)
             
             elif event == '-POST-':
-                threading.Thread(target=post_poll, daemon=True).start()
+                gui_actions.submit(post_poll)
             
             elif event == '-CONFIG-':
                 # Open configuration window
                 config_layout = [
                     [sg.Text('Zoom Configuration')],
                     [sg.Text('Zoom Client Type:'), 
-                     sg.Radio('Web Client', 'CLIENT', key='-WEB-', default=app_state["config"]["zoom_client_type"]=="web"),
-                     sg.Radio('Desktop Client', 'CLIENT', key='-DESKTOP-', default=app_state["config"]["zoom_client_type"]=="desktop")],
-                    [sg.Text('Display Name:'), sg.InputText(app_state["config"]["display_name"], key='-DISPLAY_NAME-')],
-                    [sg.Checkbox('Auto-enable Captions', key='-CAPTIONS-', default=app_state["config"]["auto_enable_captions"])],
+                     sg.Radio('Web Client', 'CLIENT', key='-WEB-', default=app_state.cfg.zoom_client_type=="web"),
+                     sg.Radio('Desktop Client', 'CLIENT', key='-DESKTOP-', default=app_state.cfg.zoom_client_type=="desktop")],
+                    [sg.Text('Display Name:'), sg.InputText(app_state.cfg.display_name, key='-DISPLAY_NAME-')],
+                    [sg.Checkbox('Auto-enable Captions', key='-CAPTIONS-', default=app_state.cfg.auto_enable_captions)],
                     [sg.HSeparator()],
                     [sg.Text('Automation Settings')],
                     [sg.Text('Transcript Interval (minutes):'), 
-                     sg.Spin([i for i in range(1, 61)], initial_value=app_state["config"]["transcript_interval"], key='-TRANSCRIPT_INT-')],
+                     sg.Spin(INTERVAL_MINUTES, initial_value=app_state.cfg.transcript_interval, key='-TRANSCRIPT_INT-')],
                     [sg.Text('Poll Interval (minutes):'), 
-                     sg.Spin([i for i in range(1, 61)], initial_value=app_state["config"]["poll_interval"], key='-POLL_INT-')],
+                     sg.Spin(INTERVAL_MINUTES, initial_value=app_state.cfg.poll_interval, key='-POLL_INT-')],
                     [sg.Text('ChatGPT Integration:'), 
-                     sg.Radio('Browser', 'INTEGRATION', key='-BROWSER-', default=app_state["config"]["chatgpt_integration_method"]=="browser"),
-                     sg.Radio('API', 'INTEGRATION', key='-API-', default=app_state["config"]["chatgpt_integration_method"]=="api")],
-                    [sg.Checkbox('Save Transcripts', key='-SAVE_TRANSCRIPTS-', default=app_state["config"]["save_transcripts"])],
+                     sg.Radio('Browser', 'INTEGRATION', key='-BROWSER-', default=app_state.cfg.chatgpt_integration_method=="browser"),
+                     sg.Radio('API', 'INTEGRATION', key='-API-', default=app_state.cfg.chatgpt_integration_method=="api")],
+                    [sg.Checkbox('Save Transcripts', key='-SAVE_TRANSCRIPTS-', default=app_state.cfg.save_transcripts)],
                     [sg.Button('Save'), sg.Button('Cancel')]
                 ]
                 
@@ -840,20 +1259,29 @@ def run_gui():
                         new_client_type = "web" if config_values['-WEB-'] else "desktop"
                         new_integration = "browser" if config_values['-BROWSER-'] else "api"
                         
-                        app_state["config"]["zoom_client_type"] = new_client_type
-                        app_state["config"]["display_name"] = config_values['-DISPLAY_NAME-']
-                        app_state["config"]["auto_enable_captions"] = config_values['-CAPTIONS-']
-                        app_state["config"]["transcript_interval"] = int(config_values['-TRANSCRIPT_INT-'])
-                        app_state["config"]["poll_interval"] = int(config_values['-POLL_INT-'])
-                        app_state["config"]["chatgpt_integration_method"] = new_integration
-                        app_state["config"]["save_transcripts"] = config_values['-SAVE_TRANSCRIPTS-']
+                        # Capture the current settings before they are overwritten
+                        old_config = dict(app_state.config)
+                        
+                        app_state.config["zoom_client_type"] = new_client_type
+                        app_state.config["display_name"] = config_values['-DISPLAY_NAME-']
+                        app_state.config["auto_enable_captions"] = config_values['-CAPTIONS-']
+                        app_state.config["transcript_interval"] = int(config_values['-TRANSCRIPT_INT-'])
+                        app_state.config["poll_interval"] = int(config_values['-POLL_INT-'])
+                        app_state.config["chatgpt_integration_method"] = new_integration
+                        app_state.config["save_transcripts"] = config_values['-SAVE_TRANSCRIPTS-']
+                        
+                        # Nothing to apply or save if the settings are unchanged
+                        if app_state.config == old_config:
+                            break
+                        
+                        refresh_config()
                         
                         # Reinitialize modules if client type changed
-                        if new_client_type != app_state["config"]["zoom_client_type"] and not app_state["meeting_active"]:
-                            initialize_modules()
+                        if new_client_type != old_config["zoom_client_type"] and not app_state.meeting_active:
+                            initialize_modules(client_modules_only=True)
                         
-                        # Save configuration
-                        save_config()
+                        # Save configuration without blocking the window
+                        schedule_config_save()
                         add_log_to_gui(window, "Configuration updated")
                         break
                 
@@ -874,8 +1302,11 @@ def run_gui():
                        "This application automates capturing transcripts from Zoom meetings,",
                        "generating polls based on the content, and posting them automatically.")
             
-            # Update GUI with current state
-            update_gui(window)
+            # Update GUI if the state changed, and write any queued log lines
+            if app_state.version != rendered_version:
+                rendered_version = app_state.version
+                update_gui(window)
+            flush_gui_log(window)
     
     except Exception as e:
         logger.error(f"Unexpected error in GUI: {str(e)}")
@@ -883,6 +1314,8 @@ def run_gui():
     finally:
         # Clean up resources
         cleanup()
+        _state_listener = None
+        logger.removeHandler(gui_handler)
         window.close()
 
 
@@ -898,7 +1331,8 @@ def main():
     
     # Set auto-start flag if provided
     if args.auto_start:
-        app_state["config"]["auto_start"] = True
+        app_state.config["auto_start"] = True
+        refresh_config()
     
     try:
         # Run in CLI or GUI mode
@@ -910,10 +1344,10 @@ def main():
                 def auto_join():
                     time.sleep(1)  # Short delay to ensure GUI is ready
                     join_meeting(args.meeting, args.passcode)
-                    if app_state["meeting_active"] and app_state["config"]["auto_start"]:
+                    if app_state.meeting_active and app_state.cfg.auto_start:
                         start_automation()
                 
-                threading.Thread(target=auto_join, daemon=True).start()
+                gui_actions.submit(auto_join)
             
             run_gui()
     except Exception as e:
@@ -0,0 +1,143 @@
+"""
+Poll Cache Module for the Automated Zoom Poll Generator.
+Caches generated polls by transcript content to avoid repeated ChatGPT requests.
+"""
+
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+from typing import Dict, Any, Optional
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+# Constants
+CACHE_FOLDER = "cache"
+CACHE_FILE = "poll_cache.json"
+DEFAULT_EXPIRE = 3600  # seconds
+
+class PollCache:
+    """
+    Persistent exact-match cache of generated polls.
+    Entries are keyed on the normalized transcript and the prompt used,
+    so editing the prompt invalidates earlier entries.
+    """
+    
+    def __init__(self, cache_path: Optional[str] = None, expire: int = DEFAULT_EXPIRE):
+        """
+        Initialize the poll cache.
+        
+        Args:
+            cache_path: Path of the JSON cache file (default: cache/poll_cache.json)
+            expire: Time in seconds before an entry expires
+        """
+        self.cache_path = cache_path or os.path.join(CACHE_FOLDER, CACHE_FILE)
+        self.expire = expire
+        self.entries = None
+        self.lock = threading.Lock()
+        
+        logger.info("PollCache initialized")
+    
+    @staticmethod
+    def make_key(transcript: str, prompt: str = "") -> str:
+        """
+        Build a cache key from the transcript and prompt.
+        
+        Args:
+            transcript: The meeting transcript text
+            prompt: The prompt template used for generation
+        
+        Returns:
+            Hex digest identifying the transcript/prompt pair
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(prompt.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(" ".join(transcript.lower().split()).encode("utf-8"))
+        return digest.hexdigest()
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached poll.
+        
+        Args:
+            key: Cache key from make_key()
+        
+        Returns:
+            Dict containing poll data or None if missing or expired
+        """
+        with self.lock:
+            entry = self._load().get(key)
+            if not entry:
+                return None
+            
+            if entry["expires"] < time.time():
+                del self.entries[key]
+                return None
+            
+            return entry["poll"]
+    
+    def set(self, key: str, poll_data: Dict[str, Any], expire: Optional[int] = None) -> bool:
+        """
+        Store a poll in the cache.
+        
+        Args:
+            key: Cache key from make_key()
+            poll_data: Dict containing poll question and options
+            expire: Optional time in seconds before the entry expires
+        
+        Returns:
+            Boolean indicating whether the cache was saved
+        """
+        with self.lock:
+            entries = self._load()
+            now = time.time()
+            
+            # Drop expired entries before writing
+            for stale_key in [k for k, v in entries.items() if v["expires"] < now]:
+                del entries[stale_key]
+            
+            entries[key] = {
+                "poll": poll_data,
+                "expires": now + (expire if expire is not None else self.expire)
+            }
+            
+            try:
+                os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+                with open(self.cache_path, 'w', encoding='utf-8') as f:
+                    json.dump(entries, f)
+                return True
+            except Exception as e:
+                logger.error(f"Error saving poll cache: {str(e)}")
+                return False
+    
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Load cache entries from disk on first use.
+        
+        Returns:
+            Dict mapping cache keys to entries
+        """
+        if self.entries is None:
+            self.entries = {}
+            try:
+                if os.path.exists(self.cache_path):
+                    with open(self.cache_path, 'r', encoding='utf-8') as f:
+                        self.entries = json.load(f)
+            except Exception as e:
+                logger.warning(f"Could not read poll cache, starting empty: {str(e)}")
+        
+        return self.entries
+
+# Helper function to create an instance with default settings
+def create_poll_cache() -> PollCache:
+    """
+    Create and return a PollCache instance with default settings.
+    
+    Returns:
+        PollCache instance
+    """
+    return PollCache()
@@ -4,39 +4,247 @@ Handles the automatic posting of generated polls to Zoom meetings.
 """
 
 import os
+import re
+import sys
+import json
 import time
 import logging
+import threading
+import http.client
 from typing import Dict, List, Any, Optional, Tuple
 
 import pyperclip
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+# pyautogui fails to import without a display; the module still loads so the
+# rest of the app can run, and posting reports the problem instead
+try:
+    import pyautogui
+except Exception:
+    pyautogui = None
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Seconds to wait after pasting before the clipboard is reused
+PASTE_DELAY = 0.05
+
+# Zoom REST API host and request timeout in seconds
+ZOOM_API_HOST = "api.zoom.us"
+ZOOM_API_TIMEOUT = 15
+
+# CSS selectors for the polls panel of the Zoom web client.
+# These are placeholders: they have not been checked against the real
+# meeting page and need replacing with the client's actual selectors.
+WEB_POLL_SELECTORS = {
+    "polls_button": 'button[aria-label*="Poll"]',
+    "add_question": ".poll-add-question-button",
+    "question": 'input[name="question"]',
+    "options": 'input[name^="answer"]',
+    "save": ".poll-save-button",
+    "launch": ".poll-launch-button",
+    "end": ".poll-end-button",
+}
+
+if sys.platform == 'win32':
+    import ctypes
+    from ctypes import wintypes
+
+    INPUT_KEYBOARD = 1
+    KEYEVENTF_KEYUP = 0x0002
+    VK_TAB = 0x09
+    VK_CONTROL = 0x11
+    VK_V = 0x56
+
+    class _MOUSEINPUT(ctypes.Structure):
+        _fields_ = [("dx", wintypes.LONG), ("dy", wintypes.LONG), ("mouseData", wintypes.DWORD),
+                    ("dwFlags", wintypes.DWORD), ("time", wintypes.DWORD),
+                    ("dwExtraInfo", ctypes.c_size_t)]
+
+    class _KEYBDINPUT(ctypes.Structure):
+        _fields_ = [("wVk", wintypes.WORD), ("wScan", wintypes.WORD), ("dwFlags", wintypes.DWORD),
+                    ("time", wintypes.DWORD), ("dwExtraInfo", ctypes.c_size_t)]
+
+    # MOUSEINPUT is the largest member, so it sets the size SendInput expects
+    class _INPUTUNION(ctypes.Union):
+        _fields_ = [("mi", _MOUSEINPUT), ("ki", _KEYBDINPUT)]
+
+    class _INPUT(ctypes.Structure):
+        _fields_ = [("type", wintypes.DWORD), ("union", _INPUTUNION)]
+
+    # Ctrl+V then Tab, as (virtual key, flags) events
+    PASTE_AND_TAB = (
+        (VK_CONTROL, 0), (VK_V, 0), (VK_V, KEYEVENTF_KEYUP), (VK_CONTROL, KEYEVENTF_KEYUP),
+        (VK_TAB, 0), (VK_TAB, KEYEVENTF_KEYUP),
+    )
+
+    def _send_keys(keys) -> int:
+        """
+        Send a sequence of key events with a single SendInput call.
+        
+        Args:
+            keys: (virtual key code, flags) pairs in order
+            
+        Returns:
+            Number of events inserted; 0 if SendInput was blocked
+        """
+        inputs = (_INPUT * len(keys))(*(
+            _INPUT(INPUT_KEYBOARD, _INPUTUNION(ki=_KEYBDINPUT(vk, 0, flags, 0, 0)))
+            for vk, flags in keys
+        ))
+        return ctypes.windll.user32.SendInput(len(keys), inputs, ctypes.sizeof(_INPUT))
+else:
+    PASTE_AND_TAB = None
+    _send_keys = None
+
+class PollPostingAPI:
+    """
+    Creates meeting polls through the Zoom REST API.
+    Keeps one HTTPS connection open so later polls skip the TCP and TLS handshakes.
+    """
+    
+    def __init__(self, access_token: str):
+        """
+        Initialize the Zoom API client.
+        
+        Args:
+            access_token: OAuth access token with the meeting:write scope
+        """
+        self.access_token = access_token
+        self.connection = None
+        self.lock = threading.Lock()
+        
+        logger.info("PollPostingAPI initialized")
+    
+    def create_poll(self, meeting_id: str, poll_data: Dict[str, Any]) -> Optional[str]:
+        """
+        Add a single-choice poll to a meeting.
+        
+        Args:
+            meeting_id: Zoom meeting ID, spaces and dashes allowed
+            poll_data: Dictionary containing poll question and options
+            
+        Returns:
+            ID of the created poll, or None if the request failed
+        """
+        meeting_id = re.sub(r"\D", "", meeting_id or "")
+        if not meeting_id:
+            logger.warning("No meeting ID available for the Zoom API")
+            return None
+        
+        body = {
+            "title": poll_data["question"][:64],
+            "questions": [{
+                "name": poll_data["question"],
+                "type": "single",
+                "answers": poll_data["options"][:10]
+            }]
+        }
+        
+        try:
+            status, response = self._request("POST", f"/v2/meetings/{meeting_id}/polls", body)
+            if status == 201:
+                logger.info("Created poll through the Zoom API")
+                return response.get("id")
+            
+            logger.error(f"Zoom API returned {status} when creating poll: {response.get('message', '')}")
+            return None
+        except Exception as e:
+            logger.error(f"Error creating poll through the Zoom API: {str(e)}")
+            return None
+    
+    def close(self) -> None:
+        """Close the HTTPS connection."""
+        with self.lock:
+            if self.connection:
+                self.connection.close()
+                self.connection = None
+    
+    def _request(self, method: str, path: str, body: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+        """
+        Send a JSON request over the persistent connection.
+        
+        Any failure drops the connection, since it may be left mid-request.
+        A connection the server has closed since the last poll is reopened
+        and the request sent once more; other errors are raised.
+        
+        Args:
+            method: HTTP method
+            path: Request path
+            body: JSON request body
+            
+        Returns:
+            Tuple of (status code, decoded JSON response)
+        """
+        payload = json.dumps(body).encode("utf-8")
+        headers = {
+            "Authorization": f"Bearer {self.access_token}",
+            "Content-Type": "application/json"
+        }
+        
+        with self.lock:
+            for attempt in range(2):
+                if self.connection is None:
+                    self.connection = http.client.HTTPSConnection(ZOOM_API_HOST, timeout=ZOOM_API_TIMEOUT)
+                try:
+                    self.connection.request(method, path, body=payload, headers=headers)
+                    response = self.connection.getresponse()
+                    data = response.read()
+                    break
+                except (OSError, http.client.HTTPException) as e:
+                    self.connection.close()
+                    self.connection = None
+                    # Only a stale keep-alive connection is worth resending on
+                    if attempt or not isinstance(e, ConnectionError):
+                        raise
+        
+        return response.status, json.loads(data) if data else {}
+
 class PollPosting:
     """
     Handles the posting of generated polls to Zoom meetings.
     Supports both desktop and web Zoom clients.
     """
     
-    def __init__(self, client_type: str = "web"):
+    def __init__(self, client_type: str = "web", api_token: Optional[str] = None):
         """
         Initialize the poll posting module.
         
         Args:
             client_type: Type of Zoom client ('web' or 'desktop')
+            api_token: Optional Zoom API access token; when set, poll questions
+                are created through the API instead of typed into the client
         """
         self.client_type = client_type.lower()
+        self.api = PollPostingAPI(api_token) if api_token else None
+        # Selenium session of the web client meeting, set by the caller once joined
+        self.driver = None
+        # Posting method for the client type, chosen once instead of on every post
+        self._post = (self._post_to_desktop_client if self.client_type == "desktop"
+                      else self._post_to_web_client)
         self.last_poll_time = None
+        # Poll dict that last passed validation, so a retried post skips the checks
+        self._validated_poll = None
+        # (poll dict, Zoom poll ID) last created through the API, so a retried post reuses it
+        self._created_poll = None
         
         logger.info(f"PollPosting initialized with {client_type} client type")
     
-    def post_poll_to_zoom(self, poll_data: Dict[str, Any]) -> bool:
+    def post_poll_to_zoom(self, poll_data: Dict[str, Any], meeting_id: Optional[str] = None) -> bool:
         """
         Post a poll to the current Zoom meeting.
         
+        With API access the poll is created through the Zoom API once, and
+        retries of the same poll only launch it again. The client's Launch
+        button starts the poll shown in the panel, so this assumes the
+        meeting has no other unlaunched polls besides the one just created.
+        
         Args:
             poll_data: Dictionary containing poll question and options
+            meeting_id: ID of the current meeting, needed to create the poll
+                through the Zoom API
             
         Returns:
             Boolean indicating whether posting was successful
@@ -48,12 +256,25 @@ class PollPosting:
             logger.error("Invalid poll data provided")
             return False
         
+        # The web client only needs pyautogui without a browser session
+        if pyautogui is None and self.driver is None:
+            logger.error("pyautogui is not available; cannot post poll")
+            return False
+        
         try:
+            # With API access the poll only has to be launched in the client
+            created = False
+            if self.api:
+                if self._created_poll and self._created_poll[0] is poll_data:
+                    created = True
+                else:
+                    poll_id = self.api.create_poll(meeting_id, poll_data)
+                    if poll_id:
+                        self._created_poll = (poll_data, poll_id)
+                        created = True
+            
             # Use appropriate posting method based on client type
-            if self.client_type == "desktop":
-                result = self._post_to_desktop_client(poll_data)
-            else:  # web client
-                result = self._post_to_web_client(poll_data)
+            result = self._post(poll_data, created)
             
             if result:
                 self.last_poll_time = time.time()
@@ -77,6 +298,10 @@ class PollPosting:
         Returns:
             Boolean indicating whether data is valid
         """
+        # Reposting the same poll after a failed attempt needs no new checks
+        if poll_data is self._validated_poll:
+            return True
+        
         # Check for required keys
         if not isinstance(poll_data, dict):
             logger.error("Poll data must be a dictionary")
@@ -103,14 +328,17 @@ class PollPosting:
         if len(options) > 10:
             logger.warning("Poll has more than 10 options, some may be truncated")
         
+        self._validated_poll = poll_data
         return True
     
-    def _post_to_desktop_client(self, poll_data: Dict[str, Any]) -> bool:
+    def _post_to_desktop_client(self, poll_data: Dict[str, Any], created: bool = False) -> bool:
         """
         Post a poll using the Zoom desktop client.
         
         Args:
             poll_data: Dictionary containing poll question and options
+            created: Whether the poll already exists in the meeting, so only
+                needs launching
             
         Returns:
             Boolean indicating whether posting was successful
@@ -118,8 +346,6 @@ class PollPosting:
         logger.info("Posting poll to Zoom desktop client")
         
         try:
-            import pyautogui
-            
             # Find and click on "Polls" button in the meeting controls
             polls_button = self._find_polls_button_desktop()
             if not polls_button:
@@ -134,33 +360,27 @@ class PollPosting:
                 logger.warning("Poll panel did not open properly")
                 return False
             
-            # Click "Add a Question" or similar button
-            add_question_button = self._find_add_question_button_desktop()
-            if not add_question_button:
-                logger.warning("Could not find Add Question button")
-                return False
-            
-            pyautogui.click(add_question_button)
-            time.sleep(0.5)
-            
-            # Enter poll question
-            pyautogui.write(poll_data["question"])
-            pyautogui.press('tab')
-            
-            # Enter each option
-            for option in poll_data["options"][:10]:  # Limit to 10 options
-                pyautogui.write(option)
-                pyautogui.press('tab')
-                time.sleep(0.2)
-            
-            # Find and click the "Save" button
-            save_button = self._find_save_button_desktop()
-            if not save_button:
-                logger.warning("Could not find Save button")
-                return False
-            
-            pyautogui.click(save_button)
-            time.sleep(1)
+            if not created:
+                # Click "Add a Question" or similar button
+                add_question_button = self._find_add_question_button_desktop()
+                if not add_question_button:
+                    logger.warning("Could not find Add Question button")
+                    return False
+                
+                pyautogui.click(add_question_button)
+                time.sleep(0.5)
+                
+                # Enter the question and each option (up to 10)
+                self._paste_fields([poll_data["question"], *poll_data["options"][:10]])
+                
+                # Find and click the "Save" button
+                save_button = self._find_save_button_desktop()
+                if not save_button:
+                    logger.warning("Could not find Save button")
+                    return False
+                
+                pyautogui.click(save_button)
+                time.sleep(1)
             
             # Find and click the "Launch Poll" button
             launch_button = self._find_launch_button_desktop()
@@ -178,25 +398,25 @@ class PollPosting:
             logger.error(f"Error posting to desktop client: {str(e)}")
             return False
     
-    def _post_to_web_client(self, poll_data: Dict[str, Any]) -> bool:
+    def _post_to_web_client(self, poll_data: Dict[str, Any], created: bool = False) -> bool:
         """
         Post a poll using the Zoom web client.
         
         Args:
             poll_data: Dictionary containing poll question and options
+            created: Whether the poll already exists in the meeting, so only
+                needs launching
             
         Returns:
             Boolean indicating whether posting was successful
         """
         logger.info("Posting poll to Zoom web client")
         
+        if self.driver:
+            return self._post_with_driver(poll_data, created)
+        
         try:
-            # For web client, we need to use a mixed approach with Selenium and PyAutoGUI
-            # depending on what part of the interface we're interacting with
-            import pyautogui
-            
-            # This is a placeholder implementation - in a real implementation
-            # you would integrate with the Selenium WebDriver instance from zoom_automation.py
+            # Without a browser session, fall back to clicking on screen
             
             # Find and click on "Polls" button in the web interface
             polls_button = self._find_polls_button_web()
@@ -218,6 +438,103 @@ class PollPosting:
             logger.error(f"Error posting to web client: {str(e)}")
             return False
     
+    def _post_with_driver(self, poll_data: Dict[str, Any], created: bool = False) -> bool:
+        """
+        Post a poll through the Selenium session of the web client.
+        
+        Controls are found by DOM queries in the meeting page instead of
+        searching screenshots, and typing goes straight to the elements.
+        This is a placeholder implementation: WEB_POLL_SELECTORS have not
+        been verified against the Zoom web client.
+        
+        Args:
+            poll_data: Dictionary containing poll question and options
+            created: Whether the poll already exists in the meeting, so only
+                needs launching
+            
+        Returns:
+            Boolean indicating whether posting was successful
+        """
+        logger.warning("Web client poll posting uses placeholder selectors that have not been verified")
+        selectors = WEB_POLL_SELECTORS
+        
+        try:
+            wait = WebDriverWait(self.driver, 10)
+            
+            # Open the polls panel
+            wait.until(EC.element_to_be_clickable(
+                (By.CSS_SELECTOR, selectors["polls_button"])
+            )).click()
+            
+            if not created:
+                # Add a question and fill in the question and options
+                wait.until(EC.element_to_be_clickable(
+                    (By.CSS_SELECTOR, selectors["add_question"])
+                )).click()
+                
+                question_input = wait.until(EC.visibility_of_element_located(
+                    (By.CSS_SELECTOR, selectors["question"])
+                ))
+                question_input.send_keys(poll_data["question"])
+                
+                option_inputs = self.driver.find_elements(By.CSS_SELECTOR, selectors["options"])
+                for option_input, option in zip(option_inputs, poll_data["options"][:10]):
+                    option_input.send_keys(option)
+                
+                self.driver.find_element(By.CSS_SELECTOR, selectors["save"]).click()
+            
+            # Launch the poll, and only report success once the launched state shows
+            wait.until(EC.element_to_be_clickable(
+                (By.CSS_SELECTOR, selectors["launch"])
+            )).click()
+            wait.until(EC.presence_of_element_located(
+                (By.CSS_SELECTOR, selectors["end"])
+            ))
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error posting poll through the web client page: {str(e)}")
+            return False
+    
+    def _paste_fields(self, fields: List[str]) -> None:
+        """
+        Fill consecutive form fields by pasting each value and tabbing to the next.
+        
+        Pasting costs one key combination per field however long the text is,
+        and handles characters that pyautogui.write() cannot type. On Windows
+        the paste and Tab go out in one SendInput call; elsewhere, or if
+        SendInput is blocked outright, pyautogui sends them. The user's
+        clipboard is restored afterwards.
+        
+        Args:
+            fields: Text for each field, in tab order
+            
+        Raises:
+            RuntimeError: If SendInput delivered only part of a field's keys,
+                since resending would paste twice and skip a field
+        """
+        previous_clipboard = pyperclip.paste()
+        previous_pause = pyautogui.PAUSE
+        # ZoomAutomation sets a 1 second pause after every pyautogui call when joining
+        pyautogui.PAUSE = 0
+        
+        try:
+            for text in fields:
+                pyperclip.copy(text)
+                sent = _send_keys(PASTE_AND_TAB) if _send_keys else 0
+                if sent == 0:
+                    pyautogui.hotkey('ctrl', 'v')
+                    pyautogui.press('tab')
+                elif sent < len(PASTE_AND_TAB):
+                    # Don't leave Ctrl held down if its release was not sent
+                    pyautogui.keyUp('ctrl')
+                    raise RuntimeError(f"SendInput sent only {sent} of {len(PASTE_AND_TAB)} key events")
+                # Let Zoom read the clipboard before it is overwritten
+                time.sleep(PASTE_DELAY)
+        finally:
+            pyautogui.PAUSE = previous_pause
+            pyperclip.copy(previous_clipboard)
+    
     def _find_polls_button_desktop(self) -> Optional[Tuple[int, int]]:
         """
         Find the "Polls" button in the desktop client.
@@ -293,6 +610,7 @@ class PollPosting:
 def create_poll_posting(client_type: str = "web") -> PollPosting:
     """
     Create and return a PollPosting instance with default settings.
+    Uses the Zoom API when ZOOM_API_TOKEN is set in the environment.
     
     Args:
         client_type: Type of Zoom client ('web' or 'desktop')
@@ -300,4 +618,4 @@ def create_poll_posting(client_type: str = "web") -> PollPosting:
     Returns:
         Configured PollPosting instance
     """
-    return PollPosting(client_type=client_type)
\ No newline at end of file
+    return PollPosting(client_type=client_type, api_token=os.environ.get("ZOOM_API_TOKEN"))
\ No newline at end of file
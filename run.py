@@ -2,7 +2,32 @@
 Run script for the Automated Zoom Poll Generator web interface.
 """
 
+import os
+import sys
+import importlib.util
+
 from app import app
 
 if __name__ == "__main__":
-    app.run(host="0.0.0.0", port=5000, debug=True)
\ No newline at end of file
+    port = int(os.environ.get("PORT", 5000))
+
+    if os.environ.get("FLASK_ENV") == "development":
+        # Werkzeug dev server with the reloader and debugger
+        app.run(host="0.0.0.0", port=port, debug=True)
+    elif sys.platform != "win32" and importlib.util.find_spec("gunicorn"):
+        # Hand the process over to gunicorn. The demo keeps its logs and
+        # poll state in module globals, so use one worker with threads
+        # rather than several processes that would each see their own copy.
+        threads = (os.cpu_count() or 1) * 2 + 1
+        os.execv(sys.executable, [
+            sys.executable, "-m", "gunicorn",
+            "-w", "1",
+            "-k", "gthread",
+            "--threads", str(threads),
+            "-b", f"0.0.0.0:{port}",
+            "app:app"
+        ])
+    else:
+        # gunicorn doesn't run on Windows (it needs fcntl) and may not be
+        # installed; serve with the threaded Werkzeug server instead
+        app.run(host="0.0.0.0", port=port, debug=False)
@@ -5,12 +5,15 @@ Handles scheduled execution of tasks at specific intervals.
 
 import os
 import time
+import heapq
 import logging
+import itertools
 from datetime import datetime, timedelta
 from typing import Callable, Dict, Any, Optional, List
-from threading import Timer, Thread, Event
+from threading import Timer, Thread, Event, Condition, current_thread, local
 
 from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.executors.pool import ThreadPoolExecutor
 from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.triggers.date import DateTrigger
 
@@ -25,7 +28,12 @@ class TaskScheduler:
     
     def __init__(self):
         """Initialize the task scheduler."""
-        self.scheduler = BackgroundScheduler()
+        # Run every job on one worker thread so capture, generation and
+        # posting never overlap, and collapse missed runs into one
+        self.scheduler = BackgroundScheduler(
+            executors={'default': ThreadPoolExecutor(max_workers=1)},
+            job_defaults={'coalesce': True, 'max_instances': 1}
+        )
         self.running = False
         self.jobs = {}  # Dictionary to keep track of scheduled jobs
         self.next_transcript_time = None
@@ -479,6 +487,122 @@ class SimpleScheduler:
         
         return status
 
+class WorkflowScheduler:
+    """
+    Runs callbacks at their due times on one long-lived daemon thread.
+    The thread sleeps until the earliest due callback instead of waking
+    on a fixed tick, and callbacks run one at a time in due-time order.
+    Each start begins a new generation; callbacks queued by an earlier
+    generation, or while stopped, never run.
+    """
+    
+    def __init__(self):
+        """Initialize the workflow scheduler."""
+        self._cv = Condition()
+        self._heap = []  # (due time, sequence, generation, callback)
+        self._sequence = itertools.count()
+        self._thread = None
+        # Bumped by stop(); worker threads record the generation they run for
+        self._generation = 0
+        self._worker = local()
+        
+        logger.info("WorkflowScheduler initialized")
+    
+    def start(self) -> bool:
+        """
+        Start the worker thread if it isn't already running.
+        
+        Returns:
+            Boolean indicating whether start was successful
+        """
+        with self._cv:
+            if self._thread is None:
+                self._thread = Thread(target=self._run, args=(self._generation,),
+                                      name="workflow-scheduler", daemon=True)
+                self._thread.start()
+                logger.info("WorkflowScheduler started")
+        return True
+    
+    def stop(self) -> bool:
+        """
+        Stop the worker thread and drop all pending callbacks.
+        A callback that is already running is allowed to finish, but
+        anything it schedules is dropped.
+        
+        Returns:
+            Boolean indicating whether stop was successful
+        """
+        with self._cv:
+            self._thread = None
+            self._generation += 1
+            self._heap.clear()
+            self._cv.notify_all()
+        logger.info("WorkflowScheduler stopped")
+        return True
+    
+    @property
+    def generation(self) -> int:
+        """Current run generation; changes every time the scheduler is stopped."""
+        return self._generation
+    
+    def call_later(self, delay_seconds: float, callback: Callable, generation: Optional[int] = None) -> None:
+        """
+        Schedule a callback to run once after a delay.
+        
+        Calls made while stopped, or from a callback of a stopped run, are
+        ignored so an old run can't reschedule itself into a new one.
+        
+        Args:
+            delay_seconds: Delay before execution in seconds
+            callback: Function to call
+            generation: Run the call belongs to, for calls made from other threads;
+                        defaults to the calling worker's run, or the current one
+        """
+        with self._cv:
+            if generation is None:
+                generation = getattr(self._worker, "generation", self._generation)
+            if self._thread is None or generation != self._generation:
+                logger.debug(f"Dropping callback scheduled outside the current run: {callback}")
+                return
+            
+            heapq.heappush(self._heap, (time.monotonic() + delay_seconds, next(self._sequence),
+                                        generation, callback))
+            self._cv.notify_all()
+    
+    def _run(self, generation: int) -> None:
+        """
+        Worker loop: wait for the earliest due callback and run it.
+        
+        Args:
+            generation: Generation this worker was started for
+        """
+        me = current_thread()
+        self._worker.generation = generation
+        
+        while True:
+            with self._cv:
+                while self._thread is me:
+                    if self._heap:
+                        timeout = self._heap[0][0] - time.monotonic()
+                        if timeout <= 0:
+                            break
+                    else:
+                        timeout = None
+                    self._cv.wait(timeout)
+                
+                # Exit if this thread was stopped (or replaced by a restart)
+                if self._thread is not me:
+                    return
+                
+                _, _, queued_generation, callback = heapq.heappop(self._heap)
+                if queued_generation != generation:
+                    continue
+            
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"Error in scheduled callback: {str(e)}")
+
 # Helper function to create an instance with appropriate implementation
 def create_scheduler(use_simple_scheduler: bool = False) -> Any:
     """
@@ -8,13 +8,27 @@ import sys
 import time
 import logging
 import subprocess
+import threading
+from functools import lru_cache
 from typing import Optional, Dict, Any, Tuple
 from urllib.parse import urlparse
 import psutil
+import cv2
+import numpy
+import win32api
 import win32gui
 import win32con
 import win32process
 import pyautogui
+import pyperclip
+from pyscreeze import Box
+
+# mss captures through a persistent device context, much faster than PIL's
+# ImageGrab behind pyautogui.screenshot(); fall back to pyautogui when it's missing
+try:
+    import mss
+except ImportError:
+    mss = None
 
 # Import selenium for web automation
 import selenium
@@ -28,6 +42,96 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Share of the screen height, from the bottom, searched for the meeting controls bar
+CONTROLS_BAR_FRACTION = 0.15
+
+# Seconds a found Zoom icon position is reused, after checking it is still there
+ICON_CACHE_TTL = 60
+
+# Template matching first runs on images scaled by PYRAMID_SCALE, for templates
+# whose smaller side is at least PYRAMID_MIN_SIZE pixels; a coarse match needs
+# PYRAMID_LENIENCY times the requested confidence before it is checked at full size
+PYRAMID_SCALE = 0.5
+PYRAMID_MIN_SIZE = 24
+PYRAMID_LENIENCY = 0.9
+
+# Zoom desktop client keyboard shortcuts, used before falling back to finding buttons on screen
+MEETING_SHORTCUTS = {
+    'win32': {'leave': ('alt', 'q')},
+    'darwin': {'leave': ('command', 'w')},
+}.get(sys.platform, {})
+
+@lru_cache(maxsize=None)
+def _load_template(image_path: str, grayscale: bool, scale: float = 1.0) -> Optional[numpy.ndarray]:
+    """
+    Load a template image once for OpenCV matching.
+    
+    Args:
+        image_path: Path of the template image
+        grayscale: Load as a single-channel grayscale image instead of BGR
+        scale: Factor to resize the image by
+        
+    Returns:
+        The template as an array, or None if the file can't be read
+    """
+    template = cv2.imread(image_path, cv2.IMREAD_GRAYSCALE if grayscale else cv2.IMREAD_COLOR)
+    if template is not None and scale != 1.0:
+        template = cv2.resize(template, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+    return template
+
+
+def _match_template(screen: numpy.ndarray, get_small_screen, image_path: str,
+                    grayscale: bool, confidence: float) -> Optional[Tuple[int, int, int, int]]:
+    """
+    Find a template on a screen capture, coarse to fine.
+    
+    Templates big enough to survive downscaling are first matched on a
+    PYRAMID_SCALE copy of the screen and template, which has a quarter of
+    the pixels. The full-size template is then only matched in a small
+    window around the best coarse position to confirm it.
+    
+    Args:
+        screen: Screen capture in the same color layout as the template
+        get_small_screen: Callable returning the capture downscaled by PYRAMID_SCALE
+        image_path: Path of the template image
+        grayscale: Whether the capture and template are grayscale
+        confidence: Minimum match confidence
+        
+    Returns:
+        (x, y, width, height) of the match within the capture, or None
+    """
+    template = _load_template(image_path, grayscale)
+    if template is None:
+        logger.debug(f"Could not read template {image_path}")
+        return None
+    
+    height, width = template.shape[:2]
+    search, offset_x, offset_y = screen, 0, 0
+    
+    if min(height, width) >= PYRAMID_MIN_SIZE:
+        small_template = _load_template(image_path, grayscale, PYRAMID_SCALE)
+        scores = cv2.matchTemplate(get_small_screen(), small_template, cv2.TM_CCOEFF_NORMED)
+        _, best_score, _, (x, y) = cv2.minMaxLoc(scores)
+        # Downscaling blurs the match a little, so the coarse pass is more lenient
+        if best_score < confidence * PYRAMID_LENIENCY:
+            return None
+        
+        # Confirm at full resolution around the coarse position
+        margin = int(2 / PYRAMID_SCALE)
+        offset_x = max(0, int(x / PYRAMID_SCALE) - margin)
+        offset_y = max(0, int(y / PYRAMID_SCALE) - margin)
+        window = screen[offset_y:offset_y + height + 2 * margin, offset_x:offset_x + width + 2 * margin]
+        if window.shape[0] >= height and window.shape[1] >= width:
+            search = window
+        else:
+            offset_x = offset_y = 0
+    
+    scores = cv2.matchTemplate(search, template, cv2.TM_CCOEFF_NORMED)
+    _, best_score, _, (x, y) = cv2.minMaxLoc(scores)
+    if best_score >= confidence:
+        return (offset_x + x, offset_y + y, width, height)
+    return None
+
 class ZoomAutomation:
     """
     Handles direct interactions with the Zoom client.
@@ -43,6 +147,16 @@ class ZoomAutomation:
         self.driver = None
         self.meeting_active = False
         self.zoom_window_handle = None
+        # Screen resolution rarely changes mid-meeting; refreshed in find_zoom_window()
+        self._screen_size = pyautogui.size()
+        # (left, top, right, bottom) of the desktop across all monitors
+        self._virtual_screen = self._get_virtual_screen()
+        # Area around the meeting control last found by the status check
+        self._last_control_region = None
+        # (box, monotonic time) of the Zoom icon last found by locate_zoom_icon()
+        self._zoom_icon_cache = None
+        # mss instances hold per-thread device contexts, so each thread gets its own
+        self._capture = threading.local()
         
         # Initialize logger
         self.configure_logging()
@@ -98,7 +212,7 @@ class ZoomAutomation:
             try:
                 # Check for Participants button (visible in screenshot)
                 participants_region = (850, 540, 150, 50)
-                if pyautogui.locateOnScreen('assets/images/participants_button.png', 
+                if pyautogui.locateOnScreen('assets/images/zoom_participants_button.png', 
                                           region=participants_region,
                                           confidence=0.8):
                     logger.info("Zoom window verified - found Participants button")
@@ -120,18 +234,33 @@ class ZoomAutomation:
                     return False
             return True
 
+        # Reuse the window found last time while it still exists, instead of enumerating every window
+        if self.zoom_window_handle and win32gui.IsWindow(self.zoom_window_handle):
+            try:
+                self._activate_zoom_window()
+                return True
+            except Exception as e:
+                logger.debug(f"Cached Zoom window could not be activated: {e}")
+        
         try:
+            self.zoom_window_handle = None
             win32gui.EnumWindows(enum_windows_callback, None)
             if self.zoom_window_handle:
-                # Bring window to front
-                win32gui.ShowWindow(self.zoom_window_handle, win32con.SW_RESTORE)
-                win32gui.SetForegroundWindow(self.zoom_window_handle)
-                time.sleep(1)  # Give window time to activate
+                self._activate_zoom_window()
                 return True
             return False
         except Exception as e:
             logger.error(f"Error finding Zoom window: {str(e)}")
             return False
+    
+    def _activate_zoom_window(self) -> None:
+        """Bring the Zoom window in zoom_window_handle to the front."""
+        win32gui.ShowWindow(self.zoom_window_handle, win32con.SW_RESTORE)
+        win32gui.SetForegroundWindow(self.zoom_window_handle)
+        time.sleep(1)  # Give window time to activate
+        # The window may have moved to another monitor or DPI setting
+        self._screen_size = pyautogui.size()
+        self._virtual_screen = self._get_virtual_screen()
 
     def _get_zoom_path(self) -> Optional[str]:
         """Get the Zoom executable path."""
@@ -305,41 +434,36 @@ class ZoomAutomation:
             logger.info("Step 2: Clicking Zoom taskbar icon...")
             zoom_pos = self.locate_zoom_icon()
             pyautogui.click(zoom_pos)
-            time.sleep(3)  # Increased wait time to ensure window appears
+            # Wait up to 3 seconds for the window to show its Join button
+            join_button = self._wait_for_any(['assets/images/zoom_join_meeting_button.png'], timeout=3)
             
             # Step 3: Click Join Meeting button
             logger.info("Step 3: Clicking Join Meeting button...")
-            pyautogui.click(x=1107, y=423)  # Coordinates for Join Meeting button
-            time.sleep(2)
+            if join_button:
+                pyautogui.click(pyautogui.center(join_button))
+            else:
+                pyautogui.click(x=1107, y=423)  # Coordinates for Join Meeting button
+            # Wait up to 2 seconds for the meeting ID dialog
+            self._wait_for_any(['assets/images/zoom_meeting_id_dialog_box.png'], timeout=2)
             
             # Rest of the steps for entering meeting ID and passcode
             logger.info("Step 4: Entering Meeting ID...")
-            pyperclip.copy(self.meeting_id)
-            time.sleep(1)
-            pyautogui.hotkey('ctrl', 'v')
-            time.sleep(1)
+            self._paste(self.meeting_id)
             pyautogui.press('enter')
             time.sleep(2)
             
             logger.info("Step 5: Entering Passcode...")
-            pyperclip.copy(self.passcode)
-            time.sleep(1)
-            pyautogui.hotkey('ctrl', 'v')
-            time.sleep(1)
+            self._paste(self.passcode)
             pyautogui.press('enter')
             
             # Final verification
             logger.info("Step 6: Verifying meeting join...")
-            time.sleep(5)  # Wait for meeting interface
-            
-            join_success = False
-            for control in ['assets/mic_button.png', 'assets/participants_button.png']:
-                try:
-                    if pyautogui.locateOnScreen(control, confidence=0.8, grayscale=True):
-                        join_success = True
-                        break
-                except Exception:
-                    continue
+            join_success = self._wait_for_any(
+                ['assets/images/zoom_mic_button.png', 'assets/images/zoom_participants_button.png'],
+                timeout=10,
+                locate=self._locate_control,
+                grayscale=True
+            ) is not None
             
             if join_success:
                 self.meeting_active = True
@@ -423,18 +547,27 @@ class ZoomAutomation:
             Boolean indicating whether leaving was successful
         """
         try:
-            # Look for the end meeting button
-            end_button = pyautogui.locateOnScreen('assets/end_button.png', confidence=0.8)
-            if not end_button:
-                logger.warning("Could not find End Meeting button")
-                return False
+            confirm_button = None
             
-            # Click the end button
-            pyautogui.click(pyautogui.center(end_button))
-            time.sleep(1)
+            # The leave shortcut opens the end/leave prompt without searching for the End button
+            if 'leave' in MEETING_SHORTCUTS and self.find_zoom_window():
+                pyautogui.hotkey(*MEETING_SHORTCUTS['leave'])
+                confirm_button = self._wait_for_any(['assets/images/zoom_confirm_end_button.png'], timeout=3)
+            
+            if not confirm_button:
+                # Look for the end meeting button
+                end_button = pyautogui.locateOnScreen('assets/images/zoom_end_button.png', confidence=0.8)
+                if not end_button:
+                    logger.warning("Could not find End Meeting button")
+                    return False
+                
+                # Click the end button
+                pyautogui.click(pyautogui.center(end_button))
+                time.sleep(1)
+                
+                # Look for the confirm end button if it appears
+                confirm_button = pyautogui.locateOnScreen('assets/images/zoom_confirm_end_button.png', confidence=0.8)
             
-            # Look for and click the confirm end button if it appears
-            confirm_button = pyautogui.locateOnScreen('assets/confirm_end_button.png', confidence=0.8)
             if confirm_button:
                 pyautogui.click(pyautogui.center(confirm_button))
             
@@ -483,6 +616,24 @@ class ZoomAutomation:
             logger.error(f"Error in web leave process: {str(e)}")
             return False
     
+    def _paste(self, text: str) -> None:
+        """
+        Paste text into the focused field through the clipboard.
+        
+        The user's clipboard is restored afterwards, so the meeting ID or
+        passcode does not stay on it.
+        
+        Args:
+            text: Text to paste
+        """
+        previous_clipboard = pyperclip.paste()
+        pyperclip.copy(text)
+        try:
+            pyautogui.hotkey('ctrl', 'v')
+            time.sleep(1)  # Let Zoom read the clipboard before it is restored
+        finally:
+            pyperclip.copy(previous_clipboard)
+    
     def _check_meeting_status_desktop(self) -> bool:
         """
         Check if in an active meeting using desktop client indicators.
@@ -493,16 +644,20 @@ class ZoomAutomation:
         try:
             # Look for meeting control buttons to verify we're in a meeting
             controls = [
-                'assets/mic_button.png',
-                'assets/participants_button.png',
-                'assets/polls_quizzes_button.jpg'
+                'assets/images/zoom_mic_button.png',
+                'assets/images/zoom_participants_button.png',
+                'assets/images/zoom_polls_quizzes_button.jpg'
             ]
             
-            for control in controls:
-                if pyautogui.locateOnScreen(control, confidence=0.8):
-                    return True
+            # Search around the control found last time before the whole controls bar
+            box = None
+            if self._last_control_region:
+                box = self._locate_any(controls, region=self._last_control_region)
+            if not box:
+                box = self._locate_control(controls)
             
-            return False
+            self._last_control_region = self._region_around(box) if box else None
+            return box is not None
             
         except Exception as e:
             logger.error(f"Error checking desktop meeting status: {str(e)}")
@@ -607,23 +762,201 @@ class ZoomAutomation:
             logger.error(f"Error initializing WebDriver: {str(e)}")
             self.driver = None
     
+    def _controls_region(self) -> Tuple[int, int, int, int]:
+        """
+        Get the screen region holding the meeting controls bar.
+        
+        The bottom of the Zoom window is used when its handle is known, so a
+        window that isn't maximized or is on another monitor is still covered.
+        
+        Returns:
+            Region (left, top, width, height) covering the bottom of the Zoom
+            window, or of the primary screen
+        """
+        if self.zoom_window_handle:
+            try:
+                left, top, right, bottom = win32gui.GetWindowRect(self.zoom_window_handle)
+                # A minimized window reports a rectangle far off screen
+                if right > left and bottom > top and not win32gui.IsIconic(self.zoom_window_handle):
+                    bar_top = bottom - max(1, int((bottom - top) * CONTROLS_BAR_FRACTION))
+                    return (left, bar_top, right - left, bottom - bar_top)
+            except Exception as e:
+                logger.debug(f"Could not get the Zoom window rectangle: {e}")
+        
+        screen_width, screen_height = self._screen_size
+        top = int(screen_height * (1 - CONTROLS_BAR_FRACTION))
+        return (0, top, screen_width, screen_height - top)
+    
+    def _locate_control(self, image_paths, **kwargs):
+        """
+        Find a meeting control in the controls bar, then anywhere on the primary screen.
+        
+        Args:
+            image_paths: Template images to look for, in order of preference
+            **kwargs: Passed on to _locate_any()
+            
+        Returns:
+            Box of the first image found, or None
+        """
+        return (self._locate_any(image_paths, region=self._controls_region(), **kwargs)
+                or self._locate_any(image_paths, **kwargs))
+    
+    @staticmethod
+    def _get_virtual_screen() -> Tuple[int, int, int, int]:
+        """
+        Get the bounds of the desktop spanning all monitors.
+        
+        Returns:
+            (left, top, right, bottom) in screen coordinates
+        """
+        left = win32api.GetSystemMetrics(win32con.SM_XVIRTUALSCREEN)
+        top = win32api.GetSystemMetrics(win32con.SM_YVIRTUALSCREEN)
+        width = win32api.GetSystemMetrics(win32con.SM_CXVIRTUALSCREEN)
+        height = win32api.GetSystemMetrics(win32con.SM_CYVIRTUALSCREEN)
+        return (left, top, left + width, top + height)
+    
+    def _region_around(self, box, margin: int = 50) -> Tuple[int, int, int, int]:
+        """
+        Get a screen region around a found image, clipped to the desktop.
+        
+        Args:
+            box: Box (left, top, width, height) of the image
+            margin: Pixels to add on each side
+            
+        Returns:
+            Region (left, top, width, height)
+        """
+        screen_left, screen_top, screen_right, screen_bottom = self._virtual_screen
+        left = max(screen_left, box.left - margin)
+        top = max(screen_top, box.top - margin)
+        right = min(screen_right, box.left + box.width + margin)
+        bottom = min(screen_bottom, box.top + box.height + margin)
+        return (left, top, right - left, bottom - top)
+    
+    def _grab_screen(self, region: Optional[Tuple[int, int, int, int]], grayscale: bool) -> numpy.ndarray:
+        """
+        Capture the screen in OpenCV's layout.
+        
+        Args:
+            region: Optional (left, top, width, height) to capture instead of the primary screen
+            grayscale: Return a single-channel grayscale image instead of BGR
+            
+        Returns:
+            The capture as an array
+        """
+        if mss is None:
+            screen = numpy.asarray(pyautogui.screenshot(region=region))
+            return cv2.cvtColor(screen, cv2.COLOR_RGB2GRAY if grayscale else cv2.COLOR_RGB2BGR)
+        
+        sct = getattr(self._capture, 'sct', None)
+        if sct is None:
+            sct = self._capture.sct = mss.mss()
+        
+        if region:
+            monitor = {'left': region[0], 'top': region[1], 'width': region[2], 'height': region[3]}
+        else:
+            monitor = sct.monitors[1]
+        
+        # mss returns BGRA pixels
+        screen = numpy.asarray(sct.grab(monitor))
+        return cv2.cvtColor(screen, cv2.COLOR_BGRA2GRAY if grayscale else cv2.COLOR_BGRA2BGR)
+    
+    def _locate_any(self, image_paths, confidence: float = 0.8, grayscale: bool = False,
+                    region: Optional[Tuple[int, int, int, int]] = None):
+        """
+        Find the first of several images on a single screenshot.
+        
+        Grabbing the screen is the slow part of template matching, so the
+        screen is captured once and every image is matched against it. The
+        capture is converted to OpenCV's layout once, templates are loaded
+        once per process, and matching runs coarse to fine with OpenCV.
+        
+        Args:
+            image_paths: Template images to look for, in order of preference
+            confidence: Minimum match confidence
+            grayscale: Match in grayscale, which is faster
+            region: Optional (left, top, width, height) to capture and search
+                instead of the whole screen
+            
+        Returns:
+            Box (left, top, width, height) of the first image found in screen
+            coordinates, or None
+        """
+        # Skip templates that can't be read before paying for a capture
+        image_paths = [path for path in image_paths if _load_template(path, grayscale) is not None]
+        if not image_paths:
+            return None
+        
+        screen = self._grab_screen(region, grayscale)
+        
+        left, top = region[:2] if region else (0, 0)
+        
+        # Downscaled copy for the coarse pass, made at most once per capture
+        small_screen = []
+        def get_small_screen():
+            if not small_screen:
+                small_screen.append(cv2.resize(screen, None, fx=PYRAMID_SCALE, fy=PYRAMID_SCALE,
+                                               interpolation=cv2.INTER_AREA))
+            return small_screen[0]
+        
+        for img_path in image_paths:
+            try:
+                match = _match_template(screen, get_small_screen, img_path, grayscale, confidence)
+                if match:
+                    x, y, width, height = match
+                    return Box(left + x, top + y, width, height)
+            except Exception as e:
+                logger.debug(f"Failed to find {img_path}: {e}")
+        
+        return None
+    
+    def _wait_for_any(self, image_paths, timeout: float, interval: float = 0.25, locate=None, **kwargs):
+        """
+        Wait until one of several images appears on screen.
+        
+        Returns as soon as a match is found instead of sleeping for the
+        worst-case time before looking.
+        
+        Args:
+            image_paths: Template images to look for, in order of preference
+            timeout: Maximum time to wait in seconds
+            interval: Delay between attempts in seconds
+            locate: Search method to use instead of _locate_any()
+            **kwargs: Passed on to the search method
+            
+        Returns:
+            Box (left, top, width, height) of the first image found, or None on timeout
+        """
+        locate = locate or self._locate_any
+        deadline = time.monotonic() + timeout
+        while True:
+            box = locate(image_paths, **kwargs)
+            if box or time.monotonic() >= deadline:
+                return box
+            time.sleep(interval)
+    
     def locate_zoom_icon(self):
         """Locate the Zoom icon on screen using multiple image variants"""
         icon_variants = [
-            ('assets/images/zoom_icon_taskbar.png', 0.8),
-            ('assets/images/zoom_icon_desktop.png', 0.8),
-            ('assets/images/zoom_icon_start.png', 0.8)
+            'assets/images/zoom_icon_taskbar.png',
+            'assets/images/zoom_icon_desktop.png',
+            'assets/images/zoom_icon_start.png'
         ]
         
-        for img_path, confidence in icon_variants:
-            try:
-                pos = pyautogui.locateCenterOnScreen(img_path, confidence=confidence)
-                if pos:
-                    logger.info(f"Found Zoom icon using {img_path}")
-                    return pos
-            except Exception as e:
-                logger.debug(f"Failed to find {img_path}: {e}")
-                continue
+        # The icon rarely moves, so first check just around where it was last seen
+        if self._zoom_icon_cache:
+            box, found_at = self._zoom_icon_cache
+            if time.monotonic() - found_at < ICON_CACHE_TTL:
+                box = self._locate_any(icon_variants, region=self._region_around(box, margin=10))
+                if box:
+                    self._zoom_icon_cache = (box, time.monotonic())
+                    return pyautogui.center(box)
+        
+        box = self._locate_any(icon_variants)
+        self._zoom_icon_cache = (box, time.monotonic()) if box else None
+        if box:
+            logger.info("Found Zoom icon")
+            return pyautogui.center(box)
         
         logger.warning("Could not find Zoom icon, using fallback coordinates")
         return (1039, 1056)
@@ -639,8 +972,7 @@ class ZoomAutomation:
                 logger.info("Successfully clicked join button using image recognition")
                 
                 # Wait for meeting ID dialog box to appear
-                time.sleep(2)
-                meeting_id_box = pyautogui.locateOnScreen('assets/images/zoom_meeting_id_dialog_box.png', confidence=0.8)
+                meeting_id_box = self._wait_for_any(['assets/images/zoom_meeting_id_dialog_box.png'], timeout=5)
                 if meeting_id_box:
                     # Click the meeting ID input box
                     pyautogui.click(pyautogui.center(meeting_id_box))
@@ -652,17 +984,16 @@ class ZoomAutomation:
             
             logger.warning("Could not find join button image, trying backup method...")
             # Backup method - try to find the button by searching in likely areas
+            # One screenshot is enough to check the button color at every candidate
+            screen = pyautogui.screenshot()
             for coords in [(850, 480), (960, 540), (1107, 423)]:
-                pyautogui.moveTo(coords[0], coords[1])
-                time.sleep(0.5)
-                # Take a small screenshot around the current position to check for button-like appearance
-                if pyautogui.pixelMatchesColor(coords[0], coords[1], (0, 122, 255), tolerance=30):
-                    pyautogui.click()
+                pixel = screen.getpixel(coords)[:3]
+                if all(abs(value - target) <= 30 for value, target in zip(pixel, (0, 122, 255))):
+                    pyautogui.click(coords[0], coords[1])
                     logger.info(f"Clicked potential join button at {coords}")
                     
                     # Wait for meeting ID dialog box to appear
-                    time.sleep(2)
-                    meeting_id_box = pyautogui.locateOnScreen('assets/images/zoom_meeting_id_dialog_box.png', confidence=0.8)
+                    meeting_id_box = self._wait_for_any(['assets/images/zoom_meeting_id_dialog_box.png'], timeout=5)
                     if meeting_id_box:
                         # Click the meeting ID input box
                         pyautogui.click(pyautogui.center(meeting_id_box))
@@ -687,7 +1018,7 @@ class ZoomAutomation:
         """
         try:
             # Try to locate the Join Meeting button image
-            location = pyautogui.locateOnScreen('assets/join_button.png', confidence=0.8)
+            location = pyautogui.locateOnScreen('assets/images/zoom_join_meeting_button.png', confidence=0.8)
             if location:
                 return pyautogui.center(location)
             